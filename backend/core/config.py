@@ -4,7 +4,7 @@ Single source of truth for all configuration values.
 """
 import os
 from functools import lru_cache
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field, validator
 
@@ -38,6 +38,80 @@ class Settings(BaseSettings):
     # Cache settings
     cache_ttl_hours: int = Field(default=24, env="CACHE_TTL_HOURS")
     
+    # Outbound HTTP client (shared by all fetchers)
+    http_timeout_seconds: float = Field(default=15.0, env="HTTP_TIMEOUT_SECONDS")
+    http_max_connections: int = Field(default=20, env="HTTP_MAX_CONNECTIONS")
+    http_max_keepalive_connections: int = Field(default=10, env="HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    
+    # Conditional request validators (ETag / Last-Modified): mongo | file | none
+    http_cache_backend: str = Field(default="mongo", env="HTTP_CACHE_BACKEND")
+    http_cache_path: str = Field(default=".cache/http_validators.json", env="HTTP_CACHE_PATH")
+    
+    # Raw-response archive for offline replay of fetchers
+    fetch_archive_enabled: bool = Field(default=False, env="FETCH_ARCHIVE_ENABLED")
+    fetch_archive_path: str = Field(default=".cache/fetch_archive", env="FETCH_ARCHIVE_PATH")
+    
+    # Refresh orchestration
+    fetch_max_concurrency: int = Field(default=4, env="FETCH_MAX_CONCURRENCY")
+    fetch_source_timeout_seconds: float = Field(default=60.0, env="FETCH_SOURCE_TIMEOUT_SECONDS")
+    bulk_write_batch_size: int = Field(default=500, env="BULK_WRITE_BATCH_SIZE")
+    
+    # Background refresh scheduler: per-source intervals as "source=hours" pairs;
+    # sources not listed use cache_ttl_hours
+    refresh_scheduler_enabled: bool = Field(default=True, env="REFRESH_SCHEDULER_ENABLED")
+    refresh_interval_hours: str = Field(
+        default="codeforces=2,hackerrank=6,hackalist=12,kaggle=24",
+        env="REFRESH_INTERVAL_HOURS"
+    )
+    refresh_jitter_ratio: float = Field(default=0.1, env="REFRESH_JITTER_RATIO")
+    refresh_retry_minutes: float = Field(default=15.0, env="REFRESH_RETRY_MINUTES")
+    refresh_poll_seconds: float = Field(default=60.0, env="REFRESH_POLL_SECONDS")
+    
+    # Cluster-wide refresh lease (one worker ingests a source at a time)
+    refresh_lease_enabled: bool = Field(default=True, env="REFRESH_LEASE_ENABLED")
+    refresh_lease_seconds: float = Field(default=90.0, env="REFRESH_LEASE_SECONDS")
+    refresh_lease_wait: bool = Field(default=False, env="REFRESH_LEASE_WAIT")
+    refresh_lease_poll_seconds: float = Field(default=1.0, env="REFRESH_LEASE_POLL_SECONDS")
+    
+    # Retries of transient upstream failures (transport errors, 429/502/503/504)
+    fetch_retry_attempts: int = Field(default=3, env="FETCH_RETRY_ATTEMPTS")
+    fetch_retry_backoff_seconds: float = Field(default=0.5, env="FETCH_RETRY_BACKOFF_SECONDS")
+    fetch_retry_max_backoff_seconds: float = Field(default=8.0, env="FETCH_RETRY_MAX_BACKOFF_SECONDS")
+    
+    # Per-source circuit breaker: opens after this many consecutive failed refreshes,
+    # for a cooldown that doubles with each further failure
+    breaker_failure_threshold: int = Field(default=3, env="BREAKER_FAILURE_THRESHOLD")
+    breaker_cooldown_seconds: float = Field(default=300.0, env="BREAKER_COOLDOWN_SECONDS")
+    breaker_max_cooldown_seconds: float = Field(default=21600.0, env="BREAKER_MAX_COOLDOWN_SECONDS")
+    
+    # Cross-source duplicate detection: records from different sources whose titles
+    # are at least this similar (Jaccard over shingles) and start within the window are linked
+    dedup_enabled: bool = Field(default=True, env="DEDUP_ENABLED")
+    dedup_similarity_threshold: float = Field(default=0.6, env="DEDUP_SIMILARITY_THRESHOLD")
+    dedup_date_window_days: float = Field(default=3.0, env="DEDUP_DATE_WINDOW_DAYS")
+    dedup_index_max_age_minutes: float = Field(default=60.0, env="DEDUP_INDEX_MAX_AGE_MINUTES")
+    
+    # In-memory search engine (engines/search.py) behind competition search; when
+    # disabled, search goes to the MongoDB text index instead
+    search_engine_enabled: bool = Field(default=True, env="SEARCH_ENGINE_ENABLED")
+    search_index_max_age_minutes: float = Field(default=60.0, env="SEARCH_INDEX_MAX_AGE_MINUTES")
+    search_max_results: int = Field(default=1000, env="SEARCH_MAX_RESULTS")
+    
+    # Archival: competitions that ended more than archive_grace_hours ago are moved
+    # to competitions_archive by the refresh scheduler every archive_interval_hours
+    archive_enabled: bool = Field(default=True, env="ARCHIVE_ENABLED")
+    archive_grace_hours: float = Field(default=24.0, env="ARCHIVE_GRACE_HOURS")
+    archive_interval_hours: float = Field(default=6.0, env="ARCHIVE_INTERVAL_HOURS")
+    
+    # Per-source ingestion stats: how many past runs are kept in metadata
+    run_history_size: int = Field(default=20, env="RUN_HISTORY_SIZE")
+    
+    # How long finished background refresh jobs stay queryable
+    refresh_job_ttl_hours: float = Field(default=24.0, env="REFRESH_JOB_TTL_HOURS")
+    
+    # Readiness: serve stored (possibly stale) data while the startup refresh runs
+    readiness_serve_stale: bool = Field(default=False, env="READINESS_SERVE_STALE")
+    
     # Rate limiting
     rate_limit_requests: int = Field(default=100, env="RATE_LIMIT_REQUESTS")
     rate_limit_window_seconds: int = Field(default=60, env="RATE_LIMIT_WINDOW")
@@ -80,6 +154,29 @@ class Settings(BaseSettings):
             "retryReads": True,
         }
     
+    @property
+    def http_client_options(self) -> dict:
+        """Get shared HTTP client options."""
+        return {
+            "timeout_seconds": self.http_timeout_seconds,
+            "max_connections": self.http_max_connections,
+            "max_keepalive_connections": self.http_max_keepalive_connections,
+        }
+    
+    @property
+    def refresh_intervals(self) -> Dict[str, float]:
+        """Parse per-source refresh intervals (hours) from "source=hours" pairs."""
+        intervals = {}
+        for pair in self.refresh_interval_hours.split(","):
+            source, _, hours = pair.partition("=")
+            if source.strip() and hours.strip():
+                intervals[source.strip().lower()] = float(hours)
+        return intervals
+    
+    def refresh_interval_for(self, source: str) -> float:
+        """Refresh interval in hours for a source."""
+        return self.refresh_intervals.get(source.lower(), float(self.cache_ttl_hours))
+    
     @validator("mongodb_url", pre=True)
     def validate_mongodb_url(cls, v):
         if v and ("<password>" in v or "<username>" in v):
@@ -4,7 +4,7 @@ Single source of truth for MongoDB connection.
 """
 import logging
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-from typing import Optional
+from typing import Dict, Optional
 
 from backend.core.config import settings
 
@@ -14,6 +14,10 @@ logger = logging.getLogger(__name__)
 _client: Optional[AsyncIOMotorClient] = None
 _db: Optional[AsyncIOMotorDatabase] = None
 
+# Weighted text index behind competition search; a title hit outranks a description hit
+COMPETITION_TEXT_INDEX = "competition_text"
+COMPETITION_TEXT_WEIGHTS = {"title": 10, "tags": 5, "platform": 3, "description": 1}
+
 
 def validate_environment() -> bool:
     """Validate database configuration at startup."""
@@ -62,8 +66,22 @@ async def create_indexes():
         await _db.competitions.create_index("category")
         await _db.competitions.create_index("difficulty")
         await _db.competitions.create_index("platform")
-        await _db.competitions.create_index("start_date")
-        await _db.competitions.create_index([("title", "text"), ("description", "text")])
+        await _db.competitions.create_index("platform_norm")
+        await _db.competitions.create_index("tags_norm")
+        # Serves start_date range queries and the (start_date, id) keyset listing
+        await _db.competitions.create_index([("start_date", 1), ("id", 1)])
+        await _db.competitions.create_index("end_date")
+        await _db.competitions.create_index("start_ts")
+        # Records linked to a canonical competition, looked up when linking and archiving
+        await _db.competitions.create_index("duplicate_of")
+        await _create_text_index(_db.competitions, COMPETITION_TEXT_INDEX, COMPETITION_TEXT_WEIGHTS)
+        
+        # Archived (ended) competitions, still looked up by ID for user history
+        await _db.competitions_archive.create_index("id", unique=True)
+        await _db.competitions_archive.create_index("end_date")
+        
+        # Metadata: background refresh job records expire on their own
+        await _db.metadata.create_index("job_expires_at", expireAfterSeconds=0)
         
         # Users indexes
         await _db.users.create_index("user_id", unique=True)
@@ -74,6 +92,20 @@ async def create_indexes():
         logger.warning(f"Index creation error (non-fatal): {e}")
 
 
+async def _create_text_index(collection, name: str, weights: Dict[str, int]):
+    """Create a weighted text index, replacing a text index over other fields (only one is allowed)."""
+    indexes = await collection.index_information()
+    for index_name, info in indexes.items():
+        if index_name != name and any(kind == "text" for _, kind in info.get("key", [])):
+            logger.info(f"Replacing text index {index_name} on {collection.name} with {name}")
+            await collection.drop_index(index_name)
+    await collection.create_index(
+        [(field, "text") for field in weights],
+        name=name,
+        weights=weights
+    )
+
+
 async def close_mongo_connection():
     """Close MongoDB connection."""
     global _client, _db
@@ -96,14 +128,14 @@ def is_connected() -> bool:
 
 def get_competitions_collection():
     """Get competitions collection."""
-    return _db.competitions if _db else None
+    return _db.competitions if _db is not None else None
 
 
 def get_users_collection():
     """Get users collection."""
-    return _db.users if _db else None
+    return _db.users if _db is not None else None
 
 
 def get_metadata_collection():
     """Get metadata collection."""
-    return _db.metadata if _db else None
+    return _db.metadata if _db is not None else None
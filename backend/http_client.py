@@ -0,0 +1,49 @@
+"""
+Shared outbound HTTP client management.
+One pooled httpx.AsyncClient is owned by the app lifespan and reused by all fetchers.
+"""
+import logging
+from typing import Optional
+
+import httpx
+
+from backend.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Global client state
+_client: Optional[httpx.AsyncClient] = None
+
+
+async def open_http_client() -> httpx.AsyncClient:
+    """Create the shared HTTP client."""
+    global _client
+    
+    if _client is not None:
+        return _client
+    
+    options = settings.http_client_options
+    _client = httpx.AsyncClient(
+        timeout=httpx.Timeout(options["timeout_seconds"]),
+        limits=httpx.Limits(
+            max_connections=options["max_connections"],
+            max_keepalive_connections=options["max_keepalive_connections"],
+        ),
+        follow_redirects=True,
+    )
+    logger.info("HTTP client opened")
+    return _client
+
+
+async def close_http_client():
+    """Close the shared HTTP client."""
+    global _client
+    if _client:
+        await _client.aclose()
+        _client = None
+        logger.info("HTTP client closed")
+
+
+def get_http_client() -> Optional[httpx.AsyncClient]:
+    """Get shared HTTP client instance."""
+    return _client
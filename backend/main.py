@@ -33,6 +33,23 @@ from backend.database import (
     get_database,
     is_connected,
 )
+from backend.http_client import (
+    open_http_client,
+    close_http_client,
+    get_http_client,
+)
+from backend.warmup import (
+    start_warmup,
+    stop_warmup,
+    mark_warmup_failed,
+    get_warmup_status,
+    is_ready,
+)
+from backend.scheduler import (
+    start_scheduler,
+    stop_scheduler,
+    get_scheduler_status,
+)
 
 # Service imports
 from backend.services.competition_service import CompetitionService
@@ -41,6 +58,7 @@ from backend.services.recommendation_service import RecommendationService
 from backend.services.fetcher_service import FetcherService
 
 # Fetcher imports
+from fetchers.base_fetcher import shutdown_parse_executor
 from fetchers.coding_contests.codeforces import CodeforcesFetcher
 from fetchers.data_science.kaggle import KaggleFetcher
 from fetchers.corporate.hackerrank import HackerRankFetcher
@@ -96,7 +114,7 @@ def get_fetcher_service() -> FetcherService:
     db = get_database()
     if db is None:
         raise HTTPException(status_code=503, detail="Database unavailable")
-    return FetcherService(db, FETCHERS)
+    return FetcherService(db, FETCHERS, get_http_client())
 
 
 # ===== LIFESPAN =====
@@ -104,16 +122,25 @@ def get_fetcher_service() -> FetcherService:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan - startup and shutdown."""
+    http_client = await open_http_client()
     try:
         await connect_to_mongo()
-        # Pre-fetch competitions on startup
+        # Pre-fetch competitions in the background so startup doesn't wait on upstreams
         if is_connected():
-            fetcher_svc = FetcherService(get_database(), FETCHERS)
-            await fetcher_svc.fetch_all_sources(force=False)
+            fetcher_svc = FetcherService(get_database(), FETCHERS, http_client)
+            warmup_task = start_warmup(fetcher_svc)
+            # Periodic per-source refreshes take over once the warm-up is done
+            start_scheduler(fetcher_svc, after=warmup_task)
     except Exception as e:
         logger.error(f"Startup error: {e}")
+        # Readiness would otherwise wait forever on a warm-up that never ran
+        mark_warmup_failed(e)
     yield
+    await stop_scheduler()
+    await stop_warmup()
     await close_mongo_connection()
+    await close_http_client()
+    shutdown_parse_executor()
 
 
 # ===== APP INITIALIZATION =====
@@ -155,22 +182,38 @@ async def get_competitions(
     time_commitment: Optional[str] = Query(None),
     search: Optional[str] = Query(None, max_length=200),
     platform: Optional[str] = Query(None),
+    tag: Optional[str] = Query(None, max_length=50),
     recruitment_only: bool = Query(False),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, max_length=500),
+    include_total: bool = Query(True),
     service: CompetitionService = Depends(get_competition_service)
 ):
-    """Get filtered and paginated competitions."""
-    return await service.get_competitions(
-        category=category,
-        difficulty=difficulty,
-        time_commitment=time_commitment,
-        platform=platform,
-        recruitment_only=recruitment_only,
-        search=search,
-        limit=limit,
-        offset=offset
-    )
+    """
+    Get filtered and paginated competitions.
+    
+    Pass the next_cursor of a response as cursor to get the following page
+    at the same cost as the first; offset paging still works. Responses
+    carry per-value facet counts for the current filter, unless
+    include_total=false skips counting.
+    """
+    try:
+        return await service.get_competitions(
+            category=category,
+            difficulty=difficulty,
+            time_commitment=time_commitment,
+            platform=platform,
+            tag=tag,
+            recruitment_only=recruitment_only,
+            search=search,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_total=include_total
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.get("/api/competitions/upcoming/week")
@@ -299,38 +342,109 @@ async def get_user_analytics(
 
 @app.post("/api/refresh")
 async def refresh_competitions(
+    wait: bool = Query(True),
     service: FetcherService = Depends(get_fetcher_service)
 ):
-    """Manually trigger a refresh of all competitions."""
-    result = await service.fetch_all_sources(force=True)
+    """
+    Manually trigger a refresh of all competitions.
+    With wait=false, returns a job ID immediately; poll /api/refresh/jobs/{job_id}.
+    """
+    if not wait:
+        job = await service.start_refresh_job(force=True)
+        return JSONResponse(status_code=202, content={
+            "success": True,
+            "job_id": job["job_id"],
+            "status": job["status"],
+            "status_url": f"/api/refresh/jobs/{job['job_id']}",
+        })
+    
+    # Sources already being refreshed by another worker report that worker's result
+    result = await service.fetch_all_sources(force=True, wait_for_lease=True)
     result["timestamp"] = datetime.now().isoformat()
     return result
 
 
+@app.get("/api/refresh/jobs/{job_id}")
+async def get_refresh_job(
+    job_id: str,
+    service: FetcherService = Depends(get_fetcher_service)
+):
+    """Get the status of a background refresh job."""
+    job = await service.get_refresh_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Refresh job not found")
+    return {"success": True, "data": job}
+
+
+@app.get("/api/sources/status")
+async def get_sources_status(
+    history: bool = Query(False),
+    service: FetcherService = Depends(get_fetcher_service)
+):
+    """
+    Get freshness, schedule, circuit breaker and last-run ingestion stats per source.
+    With history=true, includes each source's recent runs.
+    """
+    return await service.get_source_status(include_history=history)
+
+
 # ===== HEALTH CHECK =====
 
+async def ping_database() -> bool:
+    """Check that the database answers a ping."""
+    if not is_connected():
+        return False
+    try:
+        db = get_database()
+        await db.command('ping')
+        return True
+    except Exception:
+        return False
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    db_connected = is_connected()
-    
-    if db_connected:
-        try:
-            db = get_database()
-            await db.command('ping')
-        except Exception:
-            db_connected = False
+    db_connected = await ping_database()
     
     return {
         "status": "healthy" if db_connected else "degraded",
         "timestamp": datetime.utcnow().isoformat(),
         "version": settings.api_version,
         "environment": settings.environment,
+        "live": True,
+        "ready": is_ready(db_connected),
         "database": {"connected": db_connected, "name": settings.db_name},
+        "warmup": get_warmup_status(),
+        "scheduler": get_scheduler_status(),
         "fetchers": {"count": len(FETCHERS), "sources": list(FETCHERS.keys())}
     }
 
 
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe: the process is up and serving requests."""
+    return {"status": "alive", "timestamp": datetime.utcnow().isoformat()}
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness probe: 503 until the instance should take traffic."""
+    db_connected = await ping_database()
+    ready = is_ready(db_connected)
+    
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "not_ready",
+            "timestamp": datetime.utcnow().isoformat(),
+            "database": {"connected": db_connected},
+            "serve_stale": settings.readiness_serve_stale,
+            "warmup": get_warmup_status(),
+        }
+    )
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
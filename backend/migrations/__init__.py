@@ -0,0 +1 @@
+# One-off data migrations - run as modules, e.g. python -m backend.migrations.<name>
@@ -0,0 +1,133 @@
+"""
+Convert competition dates stored as ISO strings into BSON datetimes.
+
+Competition.to_dict used to write start_date, end_date,
+registration_deadline, last_updated and scraped_at as ISO strings, so
+range queries compared strings. This migration parses every string date
+in competitions and competitions_archive and stores it as a UTC datetime.
+Strings without an offset are taken to be UTC, as Competition.to_dict
+now does for naive datetimes; unparseable values are left untouched.
+It also backfills the integer epoch fields (start_ts, end_ts,
+registration_deadline_ts) that to_dict now writes next to the dates.
+
+Usage:
+    python -m backend.migrations.dates_to_bson [--dry-run]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+from backend.core.config import settings
+from backend.database import connect_to_mongo, close_mongo_connection, get_database
+from models.competition import DATE_FIELDS, EPOCH_FIELDS, to_epoch, to_utc
+
+logger = logging.getLogger(__name__)
+
+COLLECTIONS = ("competitions", "competitions_archive")
+
+
+def parse_date(value: str) -> Optional[datetime]:
+    """UTC datetime from an ISO string, or None if it does not parse."""
+    try:
+        return to_utc(datetime.fromisoformat(value.strip().replace("Z", "+00:00")))
+    except ValueError:
+        return None
+
+
+def converted_fields(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """The string date fields of a document that parse, as datetimes, plus missing epoch fields."""
+    fields: Dict[str, Any] = {}
+    for field in DATE_FIELDS:
+        value = doc.get(field)
+        if isinstance(value, str) and value:
+            parsed = parse_date(value)
+            if parsed is not None:
+                fields[field] = parsed
+            else:
+                logger.warning(f"Cannot parse {field}={value!r} of {doc.get('id')}, leaving it as is")
+    
+    for date_field, epoch_field in EPOCH_FIELDS.items():
+        value = fields.get(date_field, doc.get(date_field))
+        if isinstance(value, datetime) and doc.get(epoch_field) != to_epoch(value):
+            fields[epoch_field] = to_epoch(value)
+    return fields
+
+
+def _needs_migration() -> Dict[str, List[Dict[str, Any]]]:
+    """Documents with a string date, or a date without its epoch field."""
+    return {"$or": [
+        *({field: {"$type": "string"}} for field in DATE_FIELDS),
+        *({date_field: {"$type": "date"}, epoch_field: {"$exists": False}}
+          for date_field, epoch_field in EPOCH_FIELDS.items()),
+    ]}
+
+
+async def migrate_collection(
+    db: AsyncIOMotorDatabase,
+    name: str,
+    dry_run: bool = False,
+    batch_size: int = 500
+) -> Dict[str, int]:
+    """Convert string dates and backfill epoch fields in one collection, one bulk write per batch."""
+    stats = {"scanned": 0, "converted": 0}
+    operations = []
+    
+    cursor = db[name].find(
+        _needs_migration(),
+        {field: 1 for field in ("id", *DATE_FIELDS, *EPOCH_FIELDS.values())}
+    )
+    async for doc in cursor:
+        stats["scanned"] += 1
+        fields = converted_fields(doc)
+        if not fields:
+            continue
+        stats["converted"] += 1
+        operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": fields}))
+        
+        if len(operations) >= batch_size:
+            if not dry_run:
+                await db[name].bulk_write(operations, ordered=False)
+            operations = []
+    
+    if operations and not dry_run:
+        await db[name].bulk_write(operations, ordered=False)
+    return stats
+
+
+async def migrate(db: AsyncIOMotorDatabase, dry_run: bool = False) -> Dict[str, Dict[str, int]]:
+    """Convert string dates in every competition collection."""
+    return {
+        name: await migrate_collection(db, name, dry_run, settings.bulk_write_batch_size)
+        for name in COLLECTIONS
+    }
+
+
+async def main(dry_run: bool) -> None:
+    await connect_to_mongo()
+    try:
+        results = await migrate(get_database(), dry_run=dry_run)
+        for name, stats in results.items():
+            logger.info(
+                f"{'Dry run: ' if dry_run else ''}{name} in {settings.db_name}: "
+                f"{stats['converted']} of {stats['scanned']} documents with string dates or missing epoch fields converted"
+            )
+    finally:
+        await close_mongo_connection()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="Report conversions without writing")
+    args = parser.parse_args()
+    asyncio.run(main(args.dry_run))
@@ -0,0 +1,155 @@
+"""
+Merge duplicate competitions created by process-salted IDs.
+
+HackerRank IDs used to be built from hash(title), which changes on every
+restart, so each refresh inserted a new copy of the same competition.
+This migration recomputes the stable ID for every HackerRank and Hackalist
+document, keeps the most recently updated copy under the stable ID,
+deletes the rest and rewrites user references to the removed IDs.
+
+Usage:
+    python -m backend.migrations.dedupe_competition_ids [--dry-run]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import re
+import sys
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from backend.core.config import settings
+from backend.database import connect_to_mongo, close_mongo_connection, get_database
+from fetchers.corporate.hackerrank import HackerRankFetcher
+from fetchers.hackathons.hackalist import HackalistFetcher
+
+logger = logging.getLogger(__name__)
+
+# Prefixes of the ID schemes this migration rewrites
+MIGRATED_PREFIXES = ("hackerrank_", "hackalist_")
+
+# IDs produced by make_competition_id end in a 16-hex-digit digest
+STABLE_ID_PATTERN = re.compile(r"^[a-z_]+_[0-9a-f]{16}$")
+
+
+def _hackalist_year(doc: Dict[str, Any]) -> int:
+    """Recover the edition year used by the old and new Hackalist IDs."""
+    match = re.search(r"_(\d{4})$", doc.get("id", ""))
+    if match:
+        return int(match.group(1))
+    
+    start_date = doc.get("start_date")
+    if isinstance(start_date, str) and start_date[:4].isdigit():
+        return int(start_date[:4])
+    if isinstance(start_date, datetime):
+        return start_date.year
+    return datetime.now().year
+
+
+def stable_id_for(doc: Dict[str, Any]) -> Optional[str]:
+    """Compute the stable ID a stored competition would get from today's fetchers."""
+    comp_id = doc.get("id") or ""
+    link = doc.get("link") or ""
+    title = doc.get("title") or ""
+    
+    if STABLE_ID_PATTERN.match(comp_id):
+        # Already written by the current fetchers (or by a previous run)
+        return comp_id
+    if comp_id.startswith("hackerrank_hack_"):
+        return HackerRankFetcher.hackathon_id(link, title)
+    if comp_id.startswith("hackerrank_"):
+        return HackerRankFetcher.contest_id(link, title)
+    if comp_id.startswith("hackalist_"):
+        return HackalistFetcher.hackathon_id(link, title, _hackalist_year(doc))
+    return None
+
+
+def _last_updated(doc: Dict[str, Any]) -> str:
+    value = doc.get("last_updated") or doc.get("scraped_at") or ""
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+async def _rewrite_user_references(
+    db: AsyncIOMotorDatabase,
+    old_ids: List[str],
+    new_id: str
+) -> None:
+    """Point saved/entered/won/portfolio references at the surviving ID."""
+    users = db.users
+    
+    for field in ("saved_competitions", "portfolio_items"):
+        await users.update_many({field: {"$in": old_ids}}, {"$addToSet": {field: new_id}})
+        await users.update_many({field: {"$in": old_ids}}, {"$pull": {field: {"$in": old_ids}}})
+    
+    for field, key in (
+        ("competitions_entered", "comp_id"),
+        ("competitions_won", "comp_id"),
+        ("wins", "competition_id"),
+    ):
+        await users.update_many(
+            {f"{field}.{key}": {"$in": old_ids}},
+            {"$set": {f"{field}.$[entry].{key}": new_id}},
+            array_filters=[{f"entry.{key}": {"$in": old_ids}}]
+        )
+
+
+async def migrate(db: AsyncIOMotorDatabase, dry_run: bool = False) -> Dict[str, int]:
+    """Merge competitions that map to the same stable ID."""
+    groups: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    
+    cursor = db.competitions.find(
+        {"id": {"$regex": f"^({'|'.join(MIGRATED_PREFIXES)})"}},
+        {"_id": 0}
+    )
+    async for doc in cursor:
+        new_id = stable_id_for(doc)
+        if new_id:
+            groups[new_id].append(doc)
+    
+    stats = {"scanned": sum(len(docs) for docs in groups.values()), "rekeyed": 0, "removed": 0}
+    
+    for new_id, docs in groups.items():
+        old_ids = [doc["id"] for doc in docs if doc["id"] != new_id]
+        if not old_ids:
+            continue
+        
+        keep = max(docs, key=_last_updated)
+        stats["rekeyed"] += 1
+        stats["removed"] += len(docs) - 1
+        
+        if dry_run:
+            logger.info(f"Would merge {len(docs)} documents into {new_id}")
+            continue
+        
+        await db.competitions.replace_one({"id": new_id}, {**keep, "id": new_id}, upsert=True)
+        await db.competitions.delete_many({"id": {"$in": old_ids}})
+        await _rewrite_user_references(db, old_ids, new_id)
+    
+    return stats
+
+
+async def main(dry_run: bool) -> None:
+    await connect_to_mongo()
+    try:
+        stats = await migrate(get_database(), dry_run=dry_run)
+        logger.info(
+            f"{'Dry run: ' if dry_run else ''}scanned {stats['scanned']} competitions in {settings.db_name}, "
+            f"merged into {stats['rekeyed']} stable IDs, removed {stats['removed']} duplicates"
+        )
+    finally:
+        await close_mongo_connection()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="Report merges without writing")
+    args = parser.parse_args()
+    asyncio.run(main(args.dry_run))
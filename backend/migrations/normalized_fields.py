@@ -0,0 +1,97 @@
+"""
+Backfill the normalized platform and tag fields of stored competitions.
+
+Competition.to_dict now writes platform_norm and tags_norm, lowercase
+copies of platform and tags that the listing filters match exactly
+through their indexes. This migration fills them in for documents in
+competitions and competitions_archive written before that change.
+
+Usage:
+    python -m backend.migrations.normalized_fields [--dry-run]
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+from typing import Any, Dict
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+from backend.core.config import settings
+from backend.database import connect_to_mongo, close_mongo_connection, get_database
+from models.competition import normalize_key, normalize_tags
+
+logger = logging.getLogger(__name__)
+
+COLLECTIONS = ("competitions", "competitions_archive")
+
+
+def normalized_fields(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """The shadow fields a stored competition should have."""
+    tags = doc.get("tags")
+    return {
+        "platform_norm": normalize_key(doc.get("platform")) if isinstance(doc.get("platform"), str) else None,
+        "tags_norm": normalize_tags([tag for tag in tags if isinstance(tag, str)]) if isinstance(tags, list) else [],
+    }
+
+
+async def migrate_collection(
+    db: AsyncIOMotorDatabase,
+    name: str,
+    dry_run: bool = False,
+    batch_size: int = 500
+) -> Dict[str, int]:
+    """Set the normalized fields in one collection, one bulk write per batch."""
+    stats = {"updated": 0}
+    operations = []
+    
+    cursor = db[name].find(
+        {"$or": [{"platform_norm": {"$exists": False}}, {"tags_norm": {"$exists": False}}]},
+        {"platform": 1, "tags": 1}
+    )
+    async for doc in cursor:
+        stats["updated"] += 1
+        operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": normalized_fields(doc)}))
+        
+        if len(operations) >= batch_size:
+            if not dry_run:
+                await db[name].bulk_write(operations, ordered=False)
+            operations = []
+    
+    if operations and not dry_run:
+        await db[name].bulk_write(operations, ordered=False)
+    return stats
+
+
+async def migrate(db: AsyncIOMotorDatabase, dry_run: bool = False) -> Dict[str, Dict[str, int]]:
+    """Backfill the normalized fields in every competition collection."""
+    return {
+        name: await migrate_collection(db, name, dry_run, settings.bulk_write_batch_size)
+        for name in COLLECTIONS
+    }
+
+
+async def main(dry_run: bool) -> None:
+    await connect_to_mongo()
+    try:
+        results = await migrate(get_database(), dry_run=dry_run)
+        for name, stats in results.items():
+            logger.info(
+                f"{'Dry run: ' if dry_run else ''}{name} in {settings.db_name}: "
+                f"{stats['updated']} documents given normalized platform and tags"
+            )
+    finally:
+        await close_mongo_connection()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="Report updates without writing")
+    args = parser.parse_args()
+    asyncio.run(main(args.dry_run))
@@ -1,10 +1,12 @@
 # Repository layer - Data access abstraction
 from .base import BaseRepository
 from .competition_repository import CompetitionRepository
+from .lease_repository import LeaseRepository
 from .user_repository import UserRepository
 
 __all__ = [
     "BaseRepository",
     "CompetitionRepository",
+    "LeaseRepository",
     "UserRepository",
 ]
@@ -4,6 +4,7 @@ All repositories should inherit from this base class.
 """
 from typing import Any, Dict, Generic, List, Optional, TypeVar
 from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo.errors import BulkWriteError
 import logging
 
 T = TypeVar('T')
@@ -121,6 +122,32 @@ class BaseRepository(Generic[T]):
         """Upsert (insert or update) a single document."""
         return await self.update_one(filter_dict, document, upsert=True)
     
+    async def bulk_write(
+        self,
+        operations: List[Any],
+        ordered: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Send a batch of write operations in a single round-trip.
+        Returns the raw bulk result, including per-operation writeErrors.
+        """
+        if not operations:
+            return {"nUpserted": 0, "nMatched": 0, "nModified": 0, "writeErrors": []}
+        
+        try:
+            result = await self.collection.bulk_write(operations, ordered=ordered)
+            return result.bulk_api_result
+        except BulkWriteError as e:
+            # Partial failure: the remaining operations were still applied
+            logger.warning(
+                f"Bulk write on {self.collection_name} had "
+                f"{len(e.details.get('writeErrors', []))} failed operations"
+            )
+            return e.details
+        except Exception as e:
+            logger.error(f"Error in bulk write for {self.collection_name}: {e}")
+            raise
+    
     async def delete_one(self, filter_dict: Dict[str, Any]) -> bool:
         """Delete a single document."""
         try:
@@ -2,25 +2,57 @@
 Competition repository for data access operations.
 Handles all database operations related to competitions.
 """
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReplaceOne, UpdateOne
+import base64
+import binascii
+import json
 import logging
+import re
+import time
 
+from models.competition import normalize_key, to_utc
 from .base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+# Collections known to have a text index; a missing index is re-checked on the next search
+_text_indexed_collections = set()
+
 
 class CompetitionRepository(BaseRepository):
     """Repository for competition data access."""
     
+    # Listings skip records linked to the same competition from another source
+    CANONICAL = {"duplicate_of": None}
+    
+    # Ended competitions are moved here so hot queries only touch live data
+    ARCHIVE_COLLECTION = "competitions_archive"
+    
+    # Listing order; id breaks ties so keyset pages never skip or repeat a record
+    LISTING_SORT = [("start_date", 1), ("id", 1)]
+    
+    # Fields counted per value alongside filtered listings
+    FACET_FIELDS = ("category", "difficulty", "platform", "time_commitment")
+    
+    # Fields the regex search fallback scans when there is no text index
+    SEARCH_FIELDS = ("title", "description", "platform", "tags")
+    
+    # Fields the in-memory search engine indexes
+    SEARCH_INDEX_FIELDS = ("title", "description", "platform", "tags", "skills_required")
+    
     def __init__(self, db: AsyncIOMotorDatabase):
         super().__init__(db, "competitions")
+        self.archive = db[self.ARCHIVE_COLLECTION]
     
     async def get_by_id(self, competition_id: str) -> Optional[Dict[str, Any]]:
-        """Get a competition by its ID."""
-        return await self.find_one({"id": competition_id})
+        """Get a competition by its ID, falling back to archived competitions."""
+        competition = await self.find_one({"id": competition_id})
+        if competition is None:
+            competition = await self.archive.find_one({"id": competition_id}, {"_id": 0})
+        return competition
     
     async def get_all(
         self,
@@ -29,7 +61,7 @@ class CompetitionRepository(BaseRepository):
     ) -> List[Dict[str, Any]]:
         """Get all competitions with pagination."""
         return await self.find_many(
-            filter_dict={},
+            filter_dict=dict(self.CANONICAL),
             sort=[("start_date", 1)],
             limit=limit,
             skip=skip
@@ -44,14 +76,37 @@ class CompetitionRepository(BaseRepository):
         recruitment_only: bool = False,
         search: Optional[str] = None,
         limit: int = 100,
-        skip: int = 0
-    ) -> tuple[List[Dict[str, Any]], int]:
+        skip: int = 0,
+        cursor: Optional[str] = None,
+        tag: Optional[str] = None,
+        include_total: bool = True,
+        search_scores: Optional[Dict[str, float]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[int], Optional[Dict[str, Dict[str, int]]], Optional[str]]:
         """
-        Get filtered competitions with total count.
-        Returns (competitions, total_count) tuple.
+        Get filtered competitions with counts and a cursor to the next page.
+        Returns (competitions, total_count, facets, next_cursor) tuple.
+        
+        A search goes through the text index and ranks results by relevance
+        (each carries its "score"); ranked results page by skip only, so
+        next_cursor is None. Without a text index, search falls back to an
+        unranked regex scan. search_scores (relevance by ID, from the
+        in-memory search engine) replaces search: the filters then apply to
+        those competitions, ranked by their scores.
+        
+        The page, the total and the per-value counts of FACET_FIELDS come
+        from a single $facet aggregation, so the filter is evaluated once.
+        With include_total=False only the page is fetched, and total_count
+        and facets are None.
+        
+        With a cursor, the page starts right after the record it encodes
+        and skip is ignored; nothing is counted again, since the first page
+        already returned the counts.
+        
+        Raises:
+            ValueError: If the cursor is not a valid token, or is combined with a ranked search
         """
         # Build filter
-        filter_dict: Dict[str, Any] = {}
+        filter_dict: Dict[str, Any] = dict(self.CANONICAL)
         
         if category:
             filter_dict["category"] = category
@@ -62,83 +117,226 @@ class CompetitionRepository(BaseRepository):
         if time_commitment:
             filter_dict["time_commitment"] = time_commitment
         
-        if platform:
-            filter_dict["platform"] = {"$regex": f"^{platform}$", "$options": "i"}
+        # Platform and tag match case-insensitively through their normalized, indexed copies;
+        # blank values normalize to None and are ignored like missing ones
+        platform_norm = normalize_key(platform)
+        if platform_norm is not None:
+            filter_dict["platform_norm"] = platform_norm
+        
+        tag_norm = normalize_key(tag)
+        if tag_norm is not None:
+            filter_dict["tags_norm"] = tag_norm
         
         if recruitment_only:
             filter_dict["recruitment_potential"] = True
         
-        # For text search, use regex (text index would be better for production)
-        if search:
-            search_lower = search.lower()
-            filter_dict["$or"] = [
-                {"title": {"$regex": search, "$options": "i"}},
-                {"description": {"$regex": search, "$options": "i"}},
-                {"platform": {"$regex": search, "$options": "i"}},
-                {"tags": {"$regex": search, "$options": "i"}}
-            ]
+        score: Optional[Dict[str, Any]] = None
+        if search_scores is not None:
+            ids = list(search_scores)
+            filter_dict["id"] = {"$in": ids}
+            score = {"$arrayElemAt": [list(search_scores.values()), {"$indexOfArray": [ids, "$id"]}]}
+        elif search:
+            search_filter, text_ranked = await self._search_filter(search)
+            filter_dict.update(search_filter)
+            if text_ranked:
+                score = {"$meta": "textScore"}
+        ranked = score is not None
         
-        # Get total count
-        total = await self.count(filter_dict)
+        if cursor:
+            if ranked:
+                raise ValueError("Cursor paging is not available for search results; use offset")
+            # Keyset page: seek past the last record through the (start_date, id) index
+            filter_dict["$and"] = [self._after_filter(*self.decode_cursor(cursor))]
+            skip = 0
+            include_total = False
         
-        # Get paginated results
-        competitions = await self.find_many(
-            filter_dict=filter_dict,
-            sort=[("start_date", 1)],
-            limit=limit,
-            skip=skip
-        )
+        total: Optional[int] = None
+        facets: Optional[Dict[str, Dict[str, int]]] = None
+        
+        # The extra record only tells whether another page exists
+        if include_total:
+            competitions, total, facets = await self._facet_page(filter_dict, skip, limit + 1, score)
+        elif ranked:
+            pipeline, page = self._page_pipeline(filter_dict, skip, limit + 1, score)
+            competitions = await self.aggregate(pipeline + page)
+        else:
+            competitions = await self.find_many(
+                filter_dict=filter_dict,
+                sort=self.LISTING_SORT,
+                limit=limit + 1,
+                skip=skip
+            )
+        
+        next_cursor = None
+        if len(competitions) > limit:
+            competitions = competitions[:limit]
+            if not ranked:
+                next_cursor = self.encode_cursor(competitions[-1])
         
-        return competitions, total
+        return competitions, total, facets, next_cursor
+    
+    async def _facet_page(
+        self,
+        filter_dict: Dict[str, Any],
+        skip: int,
+        limit: int,
+        score: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Dict[str, Any]], int, Dict[str, Dict[str, int]]]:
+        """A listing page, its total and its facet counts in one round-trip."""
+        pipeline, page = self._page_pipeline(filter_dict, skip, limit, score)
+        branches: Dict[str, List[Dict[str, Any]]] = {"page": page, "total": [{"$count": "count"}]}
+        for field in self.FACET_FIELDS:
+            branches[field] = [{"$group": {"_id": f"${field}", "count": {"$sum": 1}}}]
+        
+        # $match runs before $facet, so the filter still uses the indexes
+        pipeline.append({"$facet": branches})
+        results = await self.aggregate(pipeline)
+        result = results[0] if results else {}
+        
+        total = result["total"][0]["count"] if result.get("total") else 0
+        facets = {
+            field: {
+                bucket["_id"]: bucket["count"]
+                for bucket in sorted(result.get(field, []), key=lambda bucket: -bucket["count"])
+                if bucket["_id"] is not None
+            }
+            for field in self.FACET_FIELDS
+        }
+        return result.get("page", []), total, facets
+    
+    def _page_pipeline(
+        self,
+        filter_dict: Dict[str, Any],
+        skip: int,
+        limit: int,
+        score: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Aggregation stages for a listing page, split into the stages that
+        apply to every match and those that cut out the page.
+        
+        Unranked listings sort before the split, right after $match, so the
+        sort walks the (start_date, id) index; a $facet branch could only
+        sort in memory. With a score expression, matches carry it as
+        "score" and are ranked by it within the page stages.
+        """
+        pipeline: List[Dict[str, Any]] = [{"$match": filter_dict}]
+        page: List[Dict[str, Any]] = []
+        if score is None:
+            pipeline.append({"$sort": dict(self.LISTING_SORT)})
+        else:
+            pipeline.append({"$addFields": {"score": score}})
+            page.append({"$sort": {"score": -1, **dict(self.LISTING_SORT)}})
+        
+        if skip > 0:
+            page.append({"$skip": skip})
+        page += [{"$limit": limit}, {"$project": {"_id": 0}}]
+        return pipeline, page
+    
+    async def has_text_index(self) -> bool:
+        """Whether the competitions collection has a text index to search."""
+        key = self.collection.full_name
+        if key in _text_indexed_collections:
+            return True
+        
+        indexes = await self.collection.index_information()
+        if any(kind == "text" for info in indexes.values() for _, kind in info.get("key", [])):
+            _text_indexed_collections.add(key)
+            return True
+        return False
+    
+    @staticmethod
+    def text_search_terms(search: str) -> str:
+        """
+        User input as plain $text terms.
+        Quotes and leading hyphens are dropped, so input cannot form
+        phrase matches or exclusions.
+        """
+        words = (word.lstrip("-") for word in search.replace('"', " ").replace("\\", " ").split())
+        return " ".join(word for word in words if word)
+    
+    async def _search_filter(self, search: str) -> Tuple[Dict[str, Any], bool]:
+        """Filter matching a search string, and whether its results rank by text score."""
+        if await self.has_text_index():
+            return {"$text": {"$search": self.text_search_terms(search)}}, True
+        
+        # No text index (e.g. create_indexes failed): unranked scan with the input escaped
+        logger.debug("No text index on competitions, falling back to regex search")
+        pattern = {"$regex": re.escape(search), "$options": "i"}
+        return {"$or": [{field: pattern} for field in self.SEARCH_FIELDS]}, False
+    
+    @staticmethod
+    def encode_cursor(competition: Dict[str, Any]) -> str:
+        """Opaque token for the listing position right after a competition."""
+        start_date = competition.get("start_date")
+        if isinstance(start_date, datetime):
+            start_date = to_utc(start_date).isoformat()
+        payload = json.dumps([start_date, competition.get("id")], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+    
+    @staticmethod
+    def decode_cursor(token: str) -> Tuple[Optional[datetime], str]:
+        """The (start_date, id) sort key a cursor token encodes."""
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            start_date, competition_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            if not isinstance(competition_id, str):
+                raise ValueError("cursor id must be a string")
+            if start_date is not None:
+                start_date = to_utc(datetime.fromisoformat(start_date))
+            return start_date, competition_id
+        except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid cursor: {token!r}") from e
+    
+    @staticmethod
+    def _after_filter(start_date: Optional[datetime], competition_id: str) -> Dict[str, Any]:
+        """Records after a sort key in LISTING_SORT order; undated records sort first."""
+        if start_date is None:
+            return {"$or": [
+                {"start_date": None, "id": {"$gt": competition_id}},
+                {"start_date": {"$ne": None}}
+            ]}
+        return {"$or": [
+            {"start_date": start_date, "id": {"$gt": competition_id}},
+            {"start_date": {"$gt": start_date}}
+        ]}
     
     async def get_by_ids(self, competition_ids: List[str]) -> List[Dict[str, Any]]:
-        """Get multiple competitions by their IDs."""
+        """Get multiple competitions by their IDs, including archived ones."""
         if not competition_ids:
             return []
-        return await self.find_many({"id": {"$in": competition_ids}})
+        competitions = await self.find_many({"id": {"$in": competition_ids}})
+        
+        missing = set(competition_ids) - {comp.get("id") for comp in competitions}
+        if missing:
+            cursor = self.archive.find({"id": {"$in": list(missing)}}, {"_id": 0})
+            competitions.extend(await cursor.to_list(length=None))
+        return competitions
     
     async def get_upcoming(
         self, 
         days: int = 7,
         limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
-        """Get competitions starting within the specified days."""
-        now = datetime.now()
-        end_date = now.isoformat()
+        """Get competitions starting within the specified days, as one range query on start_date."""
+        now = datetime.now(timezone.utc)
         
-        # Build date range filter
-        filter_dict = {
-            "start_date": {"$gte": now.isoformat()}
-        }
-        
-        competitions = await self.find_many(
-            filter_dict=filter_dict,
+        return await self.find_many(
+            filter_dict={
+                **self.CANONICAL,
+                "start_date": {"$gte": now, "$lte": now + timedelta(days=days)}
+            },
             sort=[("start_date", 1)],
             limit=limit
         )
-        
-        # Filter by date range (since MongoDB date comparison can be tricky with ISO strings)
-        from datetime import timedelta
-        end_threshold = now + timedelta(days=days)
-        
-        filtered = []
-        for comp in competitions:
-            start_date_str = comp.get("start_date")
-            if start_date_str:
-                try:
-                    if isinstance(start_date_str, str):
-                        start_date = datetime.fromisoformat(
-                            start_date_str.replace("Z", "+00:00")
-                        )
-                    else:
-                        start_date = start_date_str
-                    
-                    if now <= start_date <= end_threshold:
-                        filtered.append(comp)
-                except (ValueError, TypeError):
-                    continue
-        
-        return filtered
+    
+    async def get_not_started(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get competitions that have not started yet, soonest first, using the start_ts index."""
+        return await self.find_many(
+            filter_dict={**self.CANONICAL, "start_ts": {"$gte": int(time.time())}},
+            sort=[("start_ts", 1)],
+            limit=limit
+        )
     
     async def get_by_category(
         self, 
@@ -147,11 +345,99 @@ class CompetitionRepository(BaseRepository):
     ) -> List[Dict[str, Any]]:
         """Get competitions by category."""
         return await self.find_many(
-            filter_dict={"category": category},
+            filter_dict={**self.CANONICAL, "category": category},
             sort=[("start_date", 1)],
             limit=limit
         )
     
+    async def get_duplicates(self, competition_id: str) -> List[Dict[str, Any]]:
+        """Get records from other sources linked to a competition."""
+        return await self.find_many(
+            {"duplicate_of": competition_id},
+            projection={"_id": 0, "id": 1, "platform": 1, "link": 1}
+        )
+    
+    async def get_linked_ids(self, competition_ids: List[str]) -> List[str]:
+        """IDs among competition_ids that records from other sources are linked to."""
+        return await self.collection.distinct("duplicate_of", {"duplicate_of": {"$in": competition_ids}})
+    
+    async def get_duplicate_links(self, competition_ids: List[str]) -> Dict[str, str]:
+        """The duplicate_of of those competitions that are linked to another record, keyed by ID."""
+        cursor = self.collection.find(
+            {"id": {"$in": competition_ids}, "duplicate_of": {"$ne": None}},
+            {"_id": 0, "id": 1, "duplicate_of": 1}
+        )
+        return {doc["id"]: doc["duplicate_of"] async for doc in cursor}
+    
+    async def get_search_records(self) -> List[Dict[str, Any]]:
+        """Get the fields the search engine indexes, for every listed competition."""
+        cursor = self.collection.find(
+            dict(self.CANONICAL),
+            {"_id": 0, "id": 1, **{field: 1 for field in self.SEARCH_INDEX_FIELDS}}
+        )
+        return await cursor.to_list(length=None)
+    
+    async def get_dedup_records(self) -> List[Dict[str, Any]]:
+        """Get the fields cross-source duplicate detection needs, for every competition."""
+        cursor = self.collection.find(
+            {},
+            {"_id": 0, "id": 1, "title": 1, "start_date": 1, "platform": 1, "duplicate_of": 1}
+        )
+        return await cursor.to_list(length=None)
+    
+    @staticmethod
+    def _ended_filter(before: datetime) -> Dict[str, Any]:
+        """Competitions that ended before a cutoff; undated ends fall back to the start date."""
+        cutoff = to_utc(before)
+        return {
+            "id": {"$ne": None},
+            "$or": [
+                {"end_date": {"$lt": cutoff}},
+                {"end_date": None, "start_date": {"$lt": cutoff}}
+            ]
+        }
+    
+    async def archive_ended(
+        self,
+        before: datetime,
+        batch_size: int = 500
+    ) -> List[str]:
+        """
+        Move competitions that ended before a cutoff into the archive collection.
+        
+        Each batch is upserted into the archive before it is deleted here, so
+        an interrupted run leaves copies the next run overwrites, never gaps.
+        Links from other sources to an archived record are cleared so those
+        records become listable on their own.
+        
+        Returns:
+            IDs of the archived competitions
+        """
+        archived_ids: List[str] = []
+        batch_size = max(1, batch_size)
+        
+        while True:
+            cursor = self.collection.find(self._ended_filter(before), {"_id": 0}).limit(batch_size)
+            batch = await cursor.to_list(length=batch_size)
+            if not batch:
+                break
+            
+            archived_at = datetime.now()
+            await self.archive.bulk_write(
+                [ReplaceOne({"id": comp["id"]}, {**comp, "archived_at": archived_at}, upsert=True) for comp in batch],
+                ordered=False
+            )
+            batch_ids = [comp["id"] for comp in batch]
+            await self.collection.delete_many({"id": {"$in": batch_ids}})
+            archived_ids.extend(batch_ids)
+        
+        if archived_ids:
+            await self.collection.update_many(
+                {"duplicate_of": {"$in": archived_ids}},
+                {"$set": {"duplicate_of": None}}
+            )
+        return archived_ids
+    
     async def upsert_competition(self, competition: Dict[str, Any]) -> bool:
         """Insert or update a competition."""
         comp_id = competition.get("id")
@@ -161,21 +447,91 @@ class CompetitionRepository(BaseRepository):
         
         return await self.upsert_one({"id": comp_id}, competition)
     
-    async def upsert_many(self, competitions: List[Dict[str, Any]]) -> int:
+    async def upsert_many(
+        self, 
+        competitions: List[Dict[str, Any]],
+        batch_size: int = 500
+    ) -> int:
         """Bulk upsert competitions. Returns count of successful operations."""
-        count = 0
+        result = await self.bulk_upsert(competitions, batch_size)
+        return result["inserted"] + result["updated"] + result["unchanged"]
+    
+    async def bulk_upsert(
+        self,
+        competitions: List[Dict[str, Any]],
+        batch_size: int = 500
+    ) -> Dict[str, Any]:
+        """
+        Upsert competitions by ID using unordered bulk writes.
+        
+        Documents carrying a content_hash that matches the stored one are
+        skipped, so unchanged competitions cost no write. Sends one lookup
+        and one bulk round-trip per batch_size documents; failures are
+        reported per document from the bulk result.
+        """
+        stats: Dict[str, Any] = {"inserted": 0, "updated": 0, "unchanged": 0, "failed": []}
+        
+        documents = []
         for comp in competitions:
+            if not comp.get("id"):
+                logger.warning("Cannot upsert competition without ID")
+                continue
+            documents.append(comp)
+        
+        batch_size = max(1, batch_size)
+        for start in range(0, len(documents), batch_size):
+            batch = documents[start:start + batch_size]
+            
             try:
-                if await self.upsert_competition(comp):
-                    count += 1
+                stored_hashes = await self._get_content_hashes([comp["id"] for comp in batch])
             except Exception as e:
-                logger.warning(f"Failed to upsert competition {comp.get('id')}: {e}")
+                logger.warning(f"Could not load stored content hashes, writing full batch: {e}")
+                stored_hashes = {}
+            
+            changed = []
+            for comp in batch:
+                content_hash = comp.get("content_hash")
+                if content_hash and stored_hashes.get(comp["id"]) == content_hash:
+                    stats["unchanged"] += 1
+                else:
+                    changed.append(comp)
+            
+            if not changed:
                 continue
-        return count
+            
+            operations = [
+                UpdateOne({"id": comp["id"]}, {"$set": comp}, upsert=True)
+                for comp in changed
+            ]
+            
+            try:
+                result = await self.bulk_write(operations, ordered=False)
+            except Exception as e:
+                stats["failed"].extend({"id": comp["id"], "error": str(e)} for comp in changed)
+                continue
+            
+            stats["inserted"] += result.get("nUpserted", 0)
+            stats["updated"] += result.get("nMatched", 0)
+            
+            for error in result.get("writeErrors", []):
+                comp_id = changed[error["index"]]["id"]
+                logger.warning(f"Failed to upsert competition {comp_id}: {error.get('errmsg')}")
+                stats["failed"].append({"id": comp_id, "error": error.get("errmsg")})
+        
+        return stats
+    
+    async def _get_content_hashes(self, competition_ids: List[str]) -> Dict[str, Optional[str]]:
+        """Get stored content hashes keyed by competition ID."""
+        cursor = self.collection.find(
+            {"id": {"$in": competition_ids}},
+            {"_id": 0, "id": 1, "content_hash": 1}
+        )
+        return {doc["id"]: doc.get("content_hash") async for doc in cursor}
     
     async def get_stats(self) -> Dict[str, Any]:
         """Get competition statistics using aggregation."""
         pipeline = [
+            {"$match": self.CANONICAL},
             {
                 "$group": {
                     "_id": None,
@@ -220,26 +576,19 @@ class CompetitionRepository(BaseRepository):
         limit: int = 50
     ) -> List[Dict[str, Any]]:
         """
-        Full-text search on competitions.
-        Requires text index on title and description.
+        Full-text search on competitions, best matches first.
+        Falls back to an unranked regex search without a text index.
         """
-        try:
-            # Try text search first
-            cursor = self.collection.find(
-                {"$text": {"$search": query}},
-                {"_id": 0, "score": {"$meta": "textScore"}}
-            ).sort([("score", {"$meta": "textScore"})]).limit(limit)
-            
-            return await cursor.to_list(length=limit)
-        except Exception:
-            # Fallback to regex search if text index not available
-            logger.debug("Falling back to regex search")
+        search_filter, ranked = await self._search_filter(query)
+        if not ranked:
             return await self.find_many(
-                filter_dict={
-                    "$or": [
-                        {"title": {"$regex": query, "$options": "i"}},
-                        {"description": {"$regex": query, "$options": "i"}}
-                    ]
-                },
+                filter_dict={**self.CANONICAL, **search_filter},
+                sort=self.LISTING_SORT,
                 limit=limit
             )
+        return await self.find_many(
+            filter_dict={**self.CANONICAL, **search_filter},
+            projection={"_id": 0, "score": {"$meta": "textScore"}},
+            sort=[("score", {"$meta": "textScore"})],
+            limit=limit
+        )
@@ -0,0 +1,90 @@
+"""
+Lease repository for cluster-wide refresh locks.
+Leases live in the metadata collection so that only one worker at a time
+ingests a given source.
+"""
+from typing import Any, Dict, Optional
+from datetime import datetime, timedelta
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+import logging
+import os
+import socket
+import uuid
+
+from .base import BaseRepository
+
+logger = logging.getLogger(__name__)
+
+# Identifies this worker process; each LeaseRepository adds its own suffix
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+class LeaseRepository(BaseRepository):
+    """Repository for refresh leases stored in the metadata collection."""
+    
+    KEY_PREFIX = "lease:"
+    
+    def __init__(self, db: AsyncIOMotorDatabase, owner: Optional[str] = None):
+        super().__init__(db, "metadata")
+        # Unique per instance, so concurrent refreshes within one worker also exclude each other
+        self.owner = owner or f"{WORKER_ID}:{uuid.uuid4().hex[:8]}"
+    
+    def _key(self, name: str) -> str:
+        return self.KEY_PREFIX + name
+    
+    async def acquire(self, name: str, ttl_seconds: float) -> bool:
+        """
+        Try to take the lease.
+        
+        Succeeds if the lease is free, expired, or already held by this
+        instance. A live lease held elsewhere makes the upsert collide on
+        _id, which is reported as not acquired.
+        """
+        now = datetime.now()
+        try:
+            lease = await self.collection.find_one_and_update(
+                {
+                    "_id": self._key(name),
+                    "$or": [{"expires_at": {"$lte": now}}, {"owner": self.owner}],
+                },
+                {
+                    "$set": {
+                        "owner": self.owner,
+                        "acquired_at": now,
+                        "heartbeat_at": now,
+                        "expires_at": now + timedelta(seconds=ttl_seconds),
+                    },
+                    "$unset": {"released_at": ""},
+                },
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            return False
+        return lease is not None and lease.get("owner") == self.owner
+    
+    async def renew(self, name: str, ttl_seconds: float) -> bool:
+        """Extend a lease held by this instance; False if it was lost."""
+        now = datetime.now()
+        result = await self.collection.update_one(
+            {"_id": self._key(name), "owner": self.owner, "expires_at": {"$gt": now}},
+            {"$set": {"heartbeat_at": now, "expires_at": now + timedelta(seconds=ttl_seconds)}},
+        )
+        return result.matched_count == 1
+    
+    async def release(self, name: str, result: Optional[Dict[str, Any]] = None) -> None:
+        """Release a lease held by this instance, leaving the run's result for waiters."""
+        now = datetime.now()
+        fields: Dict[str, Any] = {"expires_at": now, "released_at": now}
+        if result is not None:
+            fields["last_result"] = result
+        await self.collection.update_one(
+            {"_id": self._key(name), "owner": self.owner},
+            {"$set": fields},
+        )
+    
+    async def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get the current lease document."""
+        return await self.find_one({"_id": self._key(name)}, {"_id": 0})
@@ -0,0 +1,155 @@
+"""
+In-process refresh scheduler.
+Refreshes each source on its own interval (with jitter), tracking next run
+times in the metadata collection so restarts resume the schedule. Also
+archives ended competitions every archive_interval_hours.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from backend.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshScheduler:
+    """Background loop that refreshes due sources through a FetcherService."""
+    
+    def __init__(self, fetcher_service, poll_seconds: Optional[float] = None):
+        """
+        Initialize scheduler.
+        
+        Args:
+            fetcher_service: FetcherService used to refresh sources
+            poll_seconds: Longest sleep between schedule checks (defaults to settings)
+        """
+        self.fetcher_service = fetcher_service
+        self.poll_seconds = poll_seconds or settings.refresh_poll_seconds
+        self._task: Optional[asyncio.Task] = None
+        self._last_results: Dict[str, Dict[str, Any]] = {}
+        self._next_archive_at: Optional[datetime] = None
+        self._last_archive: Optional[Dict[str, Any]] = None
+    
+    def start(self, after: Optional[asyncio.Task] = None) -> asyncio.Task:
+        """Start the scheduler loop, optionally once another task (the warm-up) is done."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(after), name="refresh-scheduler")
+            logger.info("Refresh scheduler started")
+        return self._task
+    
+    async def stop(self):
+        """Stop the scheduler loop."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            logger.info("Refresh scheduler stopped")
+        self._task = None
+    
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+    
+    async def _run(self, after: Optional[asyncio.Task]):
+        if after is not None:
+            await asyncio.wait([after])
+        
+        while True:
+            try:
+                delay = await self.run_due()
+            except Exception as e:
+                logger.error(f"Refresh scheduler error: {e}")
+                delay = self.poll_seconds
+            await asyncio.sleep(delay)
+    
+    async def run_due(self) -> float:
+        """
+        Refresh every source whose next run time has passed.
+        
+        Returns:
+            Seconds to sleep before the next check
+        """
+        now = datetime.now()
+        schedule = await self.fetcher_service.get_schedule()
+        due = [source for source, next_run_at in schedule.items() if next_run_at is None or next_run_at <= now]
+        
+        if due:
+            logger.info(f"Scheduled refresh of {', '.join(due)}")
+            summary = await self.fetcher_service.fetch_all_sources(force=True, sources=due)
+            finished = datetime.now()
+            for source, result in summary["details"].items():
+                self._last_results[source] = {
+                    "success": result.get("success", False),
+                    "finished_at": finished.isoformat(),
+                }
+                # Successful fetches reschedule themselves; failures retry sooner,
+                # but not before an open circuit breaker lets them through
+                next_run_at = self.fetcher_service.next_run_after(
+                    source, finished, failed=not result.get("success")
+                )
+                if result.get("circuit_open") and result.get("next_retry_at"):
+                    next_run_at = max(next_run_at, result["next_retry_at"])
+                await self.fetcher_service.set_next_run(source, next_run_at)
+                schedule[source] = next_run_at
+        
+        # Ended competitions are archived on their own, slower interval
+        archive_due = self._next_archive_at is None or self._next_archive_at <= datetime.now()
+        if settings.archive_enabled and archive_due:
+            self._last_archive = await self.fetcher_service.archive_ended_competitions()
+            self._next_archive_at = datetime.now() + timedelta(hours=settings.archive_interval_hours)
+        
+        upcoming = [next_run_at for next_run_at in schedule.values() if next_run_at is not None]
+        if self._next_archive_at is not None:
+            upcoming.append(self._next_archive_at)
+        if not upcoming:
+            return self.poll_seconds
+        seconds_until_next = (min(upcoming) - datetime.now()).total_seconds()
+        return min(self.poll_seconds, max(1.0, seconds_until_next))
+    
+    def get_status(self) -> Dict[str, Any]:
+        """Get scheduler state and the outcome of the last scheduled runs."""
+        return {
+            "enabled": settings.refresh_scheduler_enabled,
+            "running": self.running,
+            "poll_seconds": self.poll_seconds,
+            "last_results": dict(self._last_results),
+            "next_archive_at": self._next_archive_at.isoformat() if self._next_archive_at else None,
+            "last_archive": self._last_archive,
+        }
+
+
+# Global scheduler instance
+_scheduler: Optional[RefreshScheduler] = None
+
+
+def start_scheduler(fetcher_service, after: Optional[asyncio.Task] = None) -> Optional[RefreshScheduler]:
+    """Create and start the app-wide scheduler, unless disabled in settings."""
+    global _scheduler
+    
+    if not settings.refresh_scheduler_enabled:
+        logger.info("Refresh scheduler disabled")
+        return None
+    
+    if _scheduler is None:
+        _scheduler = RefreshScheduler(fetcher_service)
+    _scheduler.start(after)
+    return _scheduler
+
+
+async def stop_scheduler():
+    """Stop the app-wide scheduler."""
+    global _scheduler
+    if _scheduler:
+        await _scheduler.stop()
+        _scheduler = None
+
+
+def get_scheduler_status() -> Dict[str, Any]:
+    """Get app-wide scheduler status."""
+    if _scheduler is None:
+        return {"enabled": settings.refresh_scheduler_enabled, "running": False}
+    return _scheduler.get_status()
@@ -60,6 +60,7 @@ class CompetitionFilterParams(BaseModel):
     )
     search: Optional[str] = Field(None, max_length=200)
     platform: Optional[str] = Field(None, max_length=50)
+    tag: Optional[str] = Field(None, max_length=50)
     recruitment_only: bool = False
     limit: int = Field(100, ge=1, le=500)
     offset: int = Field(0, ge=0)
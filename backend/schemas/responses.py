@@ -28,11 +28,13 @@ class PaginatedResponse(BaseModel, Generic[T]):
     """Paginated response wrapper."""
     success: bool = True
     data: List[T]
-    total: int
+    total: Optional[int] = None
     limit: int
     offset: int
     page: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    facets: Optional[Dict[str, Dict[str, int]]] = None
+    next_cursor: Optional[str] = None
 
 
 class CompetitionResponse(BaseModel):
@@ -43,8 +45,8 @@ class CompetitionResponse(BaseModel):
     category: str
     description: Optional[str] = None
     url: str
-    start_date: Optional[str] = None
-    end_date: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
     difficulty: Optional[str] = None
     time_commitment: Optional[str] = None
     prize: Optional[Dict[str, Any]] = None
@@ -3,10 +3,12 @@ from .competition_service import CompetitionService
 from .user_service import UserService
 from .recommendation_service import RecommendationService
 from .fetcher_service import FetcherService
+from .search_service import SearchService
 
 __all__ = [
     "CompetitionService",
     "UserService",
     "RecommendationService",
     "FetcherService",
+    "SearchService",
 ]
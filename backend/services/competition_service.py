@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 import logging
 
 from backend.repositories.competition_repository import CompetitionRepository
+from backend.services.search_service import SearchService
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,7 @@ class CompetitionService:
     
     def __init__(self, db: AsyncIOMotorDatabase):
         self.repository = CompetitionRepository(db)
+        self.search = SearchService(db)
         self.db = db
     
     async def get_competitions(
@@ -28,13 +30,28 @@ class CompetitionService:
         recruitment_only: bool = False,
         search: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        tag: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Get filtered and paginated competitions.
-        Returns response dict with pagination metadata.
+        Returns response dict with pagination metadata and facet counts.
+        
+        Pages by offset unless a cursor (the next_cursor of a previous
+        response) is given; cursor pages omit the total and page counts.
+        With include_total=False, offset pages skip counting as well and
+        total, total_pages and facets are None.
+        
+        A search is ranked by the in-memory search engine, falling back to
+        the database's text search when the engine is unavailable.
+        
+        Raises:
+            ValueError: If the cursor is not a valid token, or is combined with search
         """
-        competitions, total = await self.repository.get_filtered(
+        search_scores = await self.search.rank(search) if search else None
+        competitions, total, facets, next_cursor = await self.repository.get_filtered(
             category=category,
             difficulty=difficulty,
             time_commitment=time_commitment,
@@ -42,9 +59,21 @@ class CompetitionService:
             recruitment_only=recruitment_only,
             search=search,
             limit=limit,
-            skip=offset
+            skip=offset,
+            cursor=cursor,
+            include_total=include_total,
+            tag=tag,
+            search_scores=search_scores
         )
         
+        if cursor:
+            return {
+                "success": True,
+                "data": competitions,
+                "limit": limit,
+                "next_cursor": next_cursor
+            }
+        
         return {
             "success": True,
             "data": competitions,
@@ -52,15 +81,23 @@ class CompetitionService:
             "limit": limit,
             "offset": offset,
             "page": offset // limit + 1 if limit > 0 else 1,
-            "total_pages": (total + limit - 1) // limit if limit > 0 else 1
+            "total_pages": (total + limit - 1) // limit if limit > 0 and total is not None else None,
+            "facets": facets,
+            "next_cursor": next_cursor
         }
     
     async def get_competition_by_id(
         self, 
         competition_id: str
     ) -> Optional[Dict[str, Any]]:
-        """Get a single competition by ID."""
-        return await self.repository.get_by_id(competition_id)
+        """
+        Get a single competition by ID.
+        Canonical records list the same competition's entries on other sources.
+        """
+        competition = await self.repository.get_by_id(competition_id)
+        if competition and not competition.get("duplicate_of"):
+            competition["also_listed_on"] = await self.repository.get_duplicates(competition_id)
+        return competition
     
     async def get_upcoming_week(self) -> Dict[str, Any]:
         """Get competitions starting in the next 7 days."""
@@ -103,8 +140,16 @@ class CompetitionService:
         query: str,
         limit: int = 50
     ) -> List[Dict[str, Any]]:
-        """Full-text search on competitions."""
-        return await self.repository.search_text(query, limit)
+        """Full-text search on competitions, best matches first."""
+        search_scores = await self.search.rank(query)
+        if search_scores is None:
+            return await self.repository.search_text(query, limit)
+        competitions, _, _, _ = await self.repository.get_filtered(
+            search_scores=search_scores,
+            limit=limit,
+            include_total=False
+        )
+        return competitions
     
     async def get_categories_summary(self) -> Dict[str, int]:
         """Get count of competitions per category."""
@@ -2,93 +2,280 @@
 Fetcher service - Orchestrates data fetching from external sources.
 Manages fetcher lifecycle, caching, and data synchronization.
 """
-from typing import Any, Dict, List, Optional
-from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 import logging
 import asyncio
+import random
+import time
+import uuid
+import weakref
 
+import httpx
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+
+from backend.core.config import settings
+from backend.repositories.competition_repository import CompetitionRepository
+from backend.repositories.lease_repository import LeaseRepository
+from backend.services.search_service import SearchService
+from engines.dedup import DuplicateIndex
+from fetchers.archive import ResponseArchive
+from fetchers.base_fetcher import as_async_fetcher
+from fetchers.retry import RetryPolicy
+from fetchers.stats import IngestStats
+from fetchers.http_cache import (
+    FileValidatorCache,
+    MongoValidatorCache,
+    NotModified,
+    ValidatorCache,
+)
+from models.competition import compute_content_hash
 
 logger = logging.getLogger(__name__)
 
+# Refreshes in flight in this process, keyed by (source, force, wait_for_lease);
+# concurrent callers asking for the same refresh share one task
+_inflight: Dict[Tuple[str, bool, bool], asyncio.Task] = {}
+
+# Refresh tasks whose circuit breaker outcome is already recorded: either the run
+# recorded its result, or a caller timed out on it first and recorded the timeout
+_breaker_recorded: "weakref.WeakSet[asyncio.Task]" = weakref.WeakSet()
+
+# Refresh tasks fetching from upstream in this worker, as opposed to waiting on
+# another worker's lease; only their timeouts count against a source's breaker
+_fetching: "weakref.WeakSet[asyncio.Task]" = weakref.WeakSet()
+
+# Background refresh jobs started by this process, keyed by job ID
+_jobs: Dict[str, asyncio.Task] = {}
+
+# Cross-source duplicate index shared by this process's refreshes, and when it was loaded
+_duplicate_index: Optional[DuplicateIndex] = None
+_duplicate_index_loaded_at: Optional[datetime] = None
+_duplicate_index_lock = asyncio.Lock()
+
 
 class FetcherService:
     """Service for managing competition data fetching."""
-    
-    def __init__(self, db: AsyncIOMotorDatabase, fetchers: Dict[str, Any]):
+
+    def __init__(
+        self, 
+        db: AsyncIOMotorDatabase, 
+        fetchers: Dict[str, Any],
+        http_client: Optional[httpx.AsyncClient] = None,
+        max_concurrency: Optional[int] = None,
+        source_timeout: Optional[float] = None
+    ):
         """
         Initialize fetcher service.
-        
+
         Args:
             db: Database connection
             fetchers: Dict of fetcher instances keyed by source name
+            http_client: Shared HTTP client used by async fetchers
+            max_concurrency: Max sources fetched at once (defaults to settings)
+            source_timeout: Per-source deadline in seconds (defaults to settings)
         """
         self.db = db
         self.fetchers = fetchers
-        self.metadata_collection = db.metadata if db else None
-        self.competitions_collection = db.competitions if db else None
-    
+        self.http_client = http_client
+        self.max_concurrency = max(1, max_concurrency or settings.fetch_max_concurrency)
+        self.source_timeout = source_timeout or settings.fetch_source_timeout_seconds
+        self.metadata_collection = db.metadata if db is not None else None
+        self.competitions_collection = db.competitions if db is not None else None
+
     async def is_source_fresh(
         self, 
         source: str, 
-        ttl_hours: int = 24
+        ttl_hours: Optional[float] = None
     ) -> bool:
-        """Check if a source's data is still fresh."""
-        if not self.metadata_collection:
+        """Check if a source's data is still fresh (defaults to the source's refresh interval)."""
+        if self.metadata_collection is None:
             return False
-        
+
+        if ttl_hours is None:
+            ttl_hours = settings.refresh_interval_for(source)
+
         try:
             metadata = await self.metadata_collection.find_one({"_id": source})
             if not metadata:
                 return False
-            
+
             last_updated = metadata.get("last_updated")
             if not last_updated:
                 return False
-            
+
             if isinstance(last_updated, str):
                 last_updated = datetime.fromisoformat(last_updated)
-            
+
             return datetime.now() - last_updated < timedelta(hours=ttl_hours)
         except Exception as e:
             logger.warning(f"Error checking source freshness for {source}: {e}")
             return False
-    
+
     async def update_source_metadata(
         self, 
         source: str,
-        count: int = 0
+        count: Optional[int] = 0
     ) -> None:
-        """Update the last_updated timestamp for a source."""
-        if not self.metadata_collection:
+        """
+        Update the last_updated timestamp for a source.
+        Pass count=None to mark the source fresh without changing its count.
+        """
+        if self.metadata_collection is None:
             return
-        
+
+        now = datetime.now()
+        fields: Dict[str, Any] = {"last_updated": now, "next_run_at": self.next_run_after(source, now)}
+        if count is not None:
+            fields["competition_count"] = count
+
         try:
             await self.metadata_collection.update_one(
                 {"_id": source},
-                {
-                    "$set": {
-                        "last_updated": datetime.now(),
-                        "competition_count": count
-                    }
-                },
+                {"$set": fields},
                 upsert=True
             )
         except Exception as e:
             logger.warning(f"Error updating metadata for {source}: {e}")
-    
+
+    def next_run_after(
+        self, 
+        source: str,
+        now: datetime,
+        failed: bool = False
+    ) -> datetime:
+        """
+        Next scheduled refresh for a source.
+
+        The source's interval (or the retry delay after a failure) is spread
+        by +/- refresh_jitter_ratio so sources and instances don't line up.
+        """
+        if failed:
+            delay = timedelta(minutes=settings.refresh_retry_minutes)
+        else:
+            delay = timedelta(hours=settings.refresh_interval_for(source))
+        jitter = settings.refresh_jitter_ratio
+        return now + delay * (1 + random.uniform(-jitter, jitter))
+
+    async def set_next_run(
+        self, 
+        source: str,
+        next_run_at: datetime
+    ) -> None:
+        """Record when the scheduler should next refresh a source."""
+        if self.metadata_collection is None:
+            return
+
+        try:
+            await self.metadata_collection.update_one(
+                {"_id": source},
+                {"$set": {"next_run_at": next_run_at}},
+                upsert=True
+            )
+        except Exception as e:
+            logger.warning(f"Error scheduling next run for {source}: {e}")
+
+    async def get_schedule(self) -> Dict[str, Optional[datetime]]:
+        """
+        Next run time per configured source.
+
+        Sources never scheduled before are due one interval after their
+        last update, or immediately if they have never been fetched.
+        """
+        schedule: Dict[str, Optional[datetime]] = {source: None for source in self.fetchers}
+        if self.metadata_collection is None:
+            return schedule
+
+        try:
+            cursor = self.metadata_collection.find(
+                {"_id": {"$in": list(self.fetchers.keys())}},
+                {"last_updated": 1, "next_run_at": 1}
+            )
+            async for metadata in cursor:
+                next_run_at = metadata.get("next_run_at")
+                last_updated = metadata.get("last_updated")
+                if next_run_at is None and last_updated is not None:
+                    if isinstance(last_updated, str):
+                        last_updated = datetime.fromisoformat(last_updated)
+                    next_run_at = last_updated + timedelta(hours=settings.refresh_interval_for(metadata["_id"]))
+                schedule[metadata["_id"]] = next_run_at
+        except Exception as e:
+            logger.warning(f"Error loading refresh schedule: {e}")
+
+        return schedule
+
     async def fetch_from_source(
         self, 
         source: str,
-        force: bool = False
+        force: bool = False,
+        replay: bool = False,
+        run_id: Optional[str] = None,
+        wait_for_lease: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
         Fetch competitions from a specific source.
-        
+
+        Concurrent calls for the same source with the same force and
+        wait_for_lease in this process are coalesced: later callers await
+        the refresh already in flight and get its result, and a forced or
+        waiting call never inherits a weaker one's skip. The shared task is
+        shielded, so a caller giving up doesn't cancel it. Replays always
+        run on their own.
+
         Args:
             source: Source name (e.g., "codeforces", "kaggle")
             force: Force refresh even if cache is fresh
-            
+            replay: Re-ingest an archived run instead of hitting the network
+            run_id: Archived run to replay (defaults to the latest)
+            wait_for_lease: Wait on another worker's refresh (defaults to settings)
+
+        Returns:
+            Dict with status and count of fetched competitions
+        """
+        if replay:
+            return await self._fetch_source(source, force, replay, run_id, wait_for_lease)
+
+        key = self._inflight_key(source, force, wait_for_lease)
+        task = _inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_source(source, force, wait_for_lease=key[2]))
+            _inflight[key] = task
+            task.add_done_callback(lambda done: _inflight.pop(key, None) if _inflight.get(key) is done else None)
+        else:
+            logger.info(f"Refresh of {source} already in flight, awaiting it")
+
+        return await asyncio.shield(task)
+
+    @staticmethod
+    def _inflight_key(source: str, force: bool, wait_for_lease: Optional[bool]) -> Tuple[str, bool, bool]:
+        """Key of a refresh in _inflight, with wait_for_lease defaulted from settings."""
+        if wait_for_lease is None:
+            wait_for_lease = settings.refresh_lease_wait
+        return source, bool(force), bool(wait_for_lease)
+
+    async def _fetch_source(
+        self, 
+        source: str,
+        force: bool = False,
+        replay: bool = False,
+        run_id: Optional[str] = None,
+        wait_for_lease: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch competitions from a specific source.
+
+        Only the worker holding the source's refresh lease fetches; the others
+        skip, or with wait_for_lease wait for the holder and return its result.
+        A forced refresh whose holder only skipped fresh data then runs itself.
+
+        Args:
+            source: Source name (e.g., "codeforces", "kaggle")
+            force: Force refresh even if cache is fresh
+            replay: Re-ingest an archived run instead of hitting the network
+            run_id: Archived run to replay (defaults to the latest)
+            wait_for_lease: Wait on another worker's refresh (defaults to settings)
+
         Returns:
             Dict with status and count of fetched competitions
         """
@@ -98,9 +285,9 @@ class FetcherService:
                 "error": f"Unknown source: {source}",
                 "source": source
             }
-        
+
         # Check if refresh is needed
-        if not force and await self.is_source_fresh(source):
+        if not force and not replay and await self.is_source_fresh(source):
             logger.info(f"Source {source} is fresh, skipping fetch")
             return {
                 "success": True,
@@ -108,43 +295,164 @@ class FetcherService:
                 "skipped": True,
                 "message": "Data is still fresh"
             }
-        
-        try:
-            logger.info(f"Fetching data from {source}...")
-            fetcher = self.fetchers[source]
-            
-            # Run fetcher (may be sync or async)
-            if asyncio.iscoroutinefunction(fetcher.run):
-                competitions = await fetcher.run()
-            else:
-                # Run sync fetcher in thread pool
-                loop = asyncio.get_event_loop()
-                competitions = await loop.run_in_executor(None, fetcher.run)
-            
-            if not competitions:
-                logger.warning(f"No competitions fetched from {source}")
+
+        # Fail fast while the source's circuit breaker is open
+        if not replay:
+            breaker = await self.get_breaker(source)
+            if breaker["state"] == "open":
+                logger.info(f"Circuit open for {source}, skipping fetch until {breaker['next_retry_at']}")
+                return {
+                    "success": False,
+                    "source": source,
+                    "status": "circuit_open",
+                    "circuit_open": True,
+                    "next_retry_at": breaker["next_retry_at"],
+                    "error": f"Circuit open after {breaker['consecutive_failures']} consecutive failures"
+                }
+
+        leases = self._get_lease_repository()
+        if leases is None:
+            return await self._fetch_and_store(source, replay, run_id)
+
+        if wait_for_lease is None:
+            wait_for_lease = settings.refresh_lease_wait
+
+        while True:
+            # Taken before trying the lease, so a holder releasing right after our
+            # failed attempt still counts as finishing the run we waited on
+            requested_at = datetime.now()
+            try:
+                acquired = await leases.acquire(source, settings.refresh_lease_seconds)
+            except Exception as e:
+                logger.warning(f"Error acquiring refresh lease for {source}, fetching without it: {e}")
+                return await self._fetch_and_store(source, replay, run_id)
+
+            if acquired:
+                break
+            if not wait_for_lease:
+                logger.info(f"Source {source} is being refreshed by another worker, skipping fetch")
                 return {
                     "success": True,
                     "source": source,
-                    "count": 0,
-                    "message": "No competitions found"
+                    "skipped": True,
+                    "leased": True,
+                    "message": "Refresh in progress on another worker"
                 }
-            
-            # Store in database
-            count = await self._store_competitions(competitions)
-            
+
+            holder_result = await self._wait_for_lease_holder(source, leases, requested_at)
+            # Only an unforced holder skips, so a forced refresh takes the lease and runs itself
+            if not (force and holder_result.get("skipped")):
+                return holder_result
+            logger.info(f"Lease holder for {source} skipped fresh data, running the forced refresh")
+
+        heartbeat = asyncio.create_task(self._heartbeat_lease(source, leases))
+        result: Dict[str, Any] = {"success": False, "source": source, "error": "Refresh cancelled"}
+        try:
+            # Another worker may have finished a refresh while we were acquiring
+            if not force and not replay and await self.is_source_fresh(source):
+                result = {
+                    "success": True,
+                    "source": source,
+                    "skipped": True,
+                    "message": "Data is still fresh"
+                }
+            else:
+                result = await self._fetch_and_store(source, replay, run_id)
+            return result
+        finally:
+            heartbeat.cancel()
+            try:
+                await leases.release(source, {**result, "finished_at": datetime.now()})
+            except Exception as e:
+                logger.warning(f"Error releasing refresh lease for {source}: {e}")
+
+    async def _fetch_and_store(
+        self, 
+        source: str,
+        replay: bool = False,
+        run_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Run a source's fetcher, store what it returns and update its circuit breaker and run history."""
+        run_stats = IngestStats()
+        started_at = datetime.now()
+        task = asyncio.current_task()
+        if not replay and task is not None:
+            _fetching.add(task)
+        result = await self._run_fetcher(source, replay, run_id, run_stats)
+        if not replay:
+            if self._claim_breaker_record(task):
+                await self._record_breaker(source, result.get("success", False), result.get("error"))
+            await self.record_run_stats(source, result, run_stats, started_at)
+        return result
+
+    async def _run_fetcher(
+        self, 
+        source: str,
+        replay: bool = False,
+        run_id: Optional[str] = None,
+        run_stats: Optional[IngestStats] = None
+    ) -> Dict[str, Any]:
+        """Run a source's fetcher and store what it returns, counting into run_stats."""
+        try:
+            logger.info(f"Fetching data from {source}...")
+            # Sync fetchers are wrapped so they run on a dedicated thread pool
+            fetcher = as_async_fetcher(self.fetchers[source])
+            session = fetcher.open_session(
+                self.http_client,
+                validators=self._get_validator_cache(),
+                archive=self._get_archive(replay),
+                replay=replay,
+                run_id=run_id,
+                retry=self._get_retry_policy(),
+                stats=run_stats
+            )
+            async with session:
+                try:
+                    # Store in batches while the source is still being parsed,
+                    # skipping competitions whose content is unchanged
+                    stats = await self._store_stream(fetcher.iter_competitions(session), session.stats)
+                except NotModified:
+                    # Upstream answered 304: nothing to parse or store
+                    await self.update_source_metadata(source, count=None)
+                    return {
+                        "success": True,
+                        "source": source,
+                        "count": 0,
+                        "not_modified": True,
+                        "message": "Upstream data not modified"
+                    }
+
+                if not stats.pop("received"):
+                    logger.warning(f"No competitions fetched from {source}")
+                    return {
+                        "success": True,
+                        "source": source,
+                        "count": 0,
+                        "message": "No competitions found"
+                    }
+
+                count = stats["inserted"] + stats["updated"] + stats["unchanged"]
+
+                # Only remember validators once the data they describe is stored
+                if not stats["failed"]:
+                    await session.commit()
+
             # Update metadata
             await self.update_source_metadata(source, count)
-            
-            logger.info(f"Successfully fetched {count} competitions from {source}")
-            
+
+            logger.info(
+                f"Successfully fetched {count} competitions from {source} "
+                f"({stats['inserted']} new, {stats['updated']} updated, {stats['unchanged']} unchanged)"
+            )
+
             return {
                 "success": True,
                 "source": source,
                 "count": count,
+                **stats,
                 "message": f"Fetched {count} competitions"
             }
-            
+
         except Exception as e:
             logger.error(f"Error fetching from {source}: {e}")
             return {
@@ -152,107 +460,653 @@ class FetcherService:
                 "source": source,
                 "error": str(e)
             }
-    
+
+    async def get_breaker(self, source: str) -> Dict[str, Any]:
+        """
+        Circuit breaker state for a source.
+
+        An open breaker whose next_retry_at has passed is reported as
+        half_open: the next refresh is let through as a trial.
+        """
+        breaker = {"state": "closed", "consecutive_failures": 0, "opened_at": None, "next_retry_at": None}
+        if self.metadata_collection is None:
+            return breaker
+
+        try:
+            metadata = await self.metadata_collection.find_one({"_id": source}, {"breaker": 1})
+        except Exception as e:
+            logger.warning(f"Error loading circuit breaker for {source}: {e}")
+            return breaker
+
+        breaker.update((metadata or {}).get("breaker", {}))
+        if breaker["state"] == "open" and breaker["next_retry_at"] and breaker["next_retry_at"] <= datetime.now():
+            breaker["state"] = "half_open"
+        return breaker
+
+    async def _record_breaker(
+        self, 
+        source: str,
+        success: bool,
+        error: Optional[str] = None
+    ) -> None:
+        """
+        Update a source's circuit breaker after a fetch.
+
+        A success closes the breaker. Each failure is counted; from
+        breaker_failure_threshold consecutive failures on, the breaker opens
+        for a cooldown that doubles with every further failure.
+        """
+        if self.metadata_collection is None:
+            return
+
+        try:
+            if success:
+                result = await self.metadata_collection.update_one(
+                    {"_id": source, "breaker.consecutive_failures": {"$gt": 0}},
+                    {"$set": {"breaker": {"state": "closed", "consecutive_failures": 0}}}
+                )
+                if result.modified_count:
+                    logger.info(f"Circuit closed for {source}")
+                return
+
+            now = datetime.now()
+            metadata = await self.metadata_collection.find_one_and_update(
+                {"_id": source},
+                {
+                    "$inc": {"breaker.consecutive_failures": 1},
+                    "$set": {"breaker.last_error": error, "breaker.last_failure_at": now}
+                },
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            failures = metadata["breaker"]["consecutive_failures"]
+            if failures < settings.breaker_failure_threshold:
+                return
+
+            cooldown = min(
+                settings.breaker_max_cooldown_seconds,
+                settings.breaker_cooldown_seconds * 2 ** (failures - settings.breaker_failure_threshold)
+            )
+            cooldown *= 1 + random.uniform(-settings.refresh_jitter_ratio, settings.refresh_jitter_ratio)
+            next_retry_at = now + timedelta(seconds=cooldown)
+            await self.metadata_collection.update_one(
+                {"_id": source},
+                {"$set": {
+                    "breaker.state": "open",
+                    "breaker.opened_at": now,
+                    "breaker.next_retry_at": next_retry_at
+                }}
+            )
+            logger.warning(
+                f"Circuit open for {source} after {failures} consecutive failures, "
+                f"next attempt after {next_retry_at.isoformat()}"
+            )
+        except Exception as e:
+            logger.warning(f"Error updating circuit breaker for {source}: {e}")
+
+    async def record_run_stats(
+        self, 
+        source: str,
+        result: Dict[str, Any],
+        run_stats: IngestStats,
+        started_at: datetime
+    ) -> None:
+        """
+        Store a run's counters and stage timings for a source.
+
+        The latest run is kept as last_run and appended to run_history,
+        which is capped at settings.run_history_size entries.
+        """
+        finished_at = datetime.now()
+        run = {
+            "started_at": started_at,
+            "finished_at": finished_at,
+            "duration_ms": round((finished_at - started_at).total_seconds() * 1000, 1),
+            "success": result.get("success", False),
+            "not_modified": result.get("not_modified", False),
+            "error": result.get("error"),
+            **run_stats.to_dict()
+        }
+        stage_ms = run["stage_ms"]
+        logger.info(
+            f"{source} run stats: {run['bytes_fetched']} bytes, {run['parsed']} parsed, "
+            f"{run['rejected']} rejected, {run['duplicates']} duplicates, "
+            f"{run['inserted'] + run['updated']} written; "
+            + ", ".join(f"{stage} {ms:.0f}ms" for stage, ms in stage_ms.items())
+        )
+
+        if self.metadata_collection is None:
+            return
+
+        try:
+            await self.metadata_collection.update_one(
+                {"_id": source},
+                {
+                    "$set": {"last_run": run},
+                    "$push": {"run_history": {"$each": [run], "$slice": -settings.run_history_size}}
+                },
+                upsert=True
+            )
+        except Exception as e:
+            logger.warning(f"Error recording run stats for {source}: {e}")
+
+    async def _heartbeat_lease(
+        self, 
+        source: str,
+        leases: LeaseRepository
+    ) -> None:
+        """Keep extending a held lease while the refresh runs."""
+        interval = settings.refresh_lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await leases.renew(source, settings.refresh_lease_seconds):
+                    logger.warning(f"Lost refresh lease for {source}")
+                    return
+            except Exception as e:
+                logger.warning(f"Error renewing refresh lease for {source}: {e}")
+
+    async def _wait_for_lease_holder(
+        self, 
+        source: str,
+        leases: LeaseRepository,
+        since: datetime
+    ) -> Dict[str, Any]:
+        """Wait until another worker's refresh of source, released after since, ends and return its result."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.source_timeout
+
+        while loop.time() < deadline:
+            await asyncio.sleep(settings.refresh_lease_poll_seconds)
+            lease = await leases.get(source)
+            if lease is None:
+                break
+            released_at = lease.get("released_at")
+            if released_at and released_at >= since:
+                last_result = lease.get("last_result") or {}
+                return {
+                    **last_result,
+                    "source": source,
+                    "waited_for": lease.get("owner"),
+                }
+            if lease.get("expires_at") and lease["expires_at"] <= datetime.now():
+                break
+
+        return {
+            "success": False,
+            "source": source,
+            "error": "Refresh lease holder did not finish"
+        }
+
     async def fetch_all_sources(
         self, 
         force: bool = False,
-        sources: Optional[List[str]] = None
+        sources: Optional[List[str]] = None,
+        wait_for_lease: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
-        Fetch from all configured sources.
-        
+        Fetch from all configured sources concurrently.
+
+        At most max_concurrency sources run at once, and each source gets
+        source_timeout seconds once it starts; a source that misses its
+        deadline is reported as timed_out without holding up the rest.
+
         Args:
             force: Force refresh all sources
             sources: Optional list of specific sources to refresh
-            
+            wait_for_lease: Wait on sources being refreshed by another worker
+
         Returns:
             Dict with results for each source
         """
         target_sources = sources or list(self.fetchers.keys())
-        results = {}
-        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        started = time.monotonic()
+
+        async def run_source(source: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._fetch_with_deadline(source, force, wait_for_lease)
+
+        outcomes = await asyncio.gather(*(run_source(source) for source in target_sources))
+        results = dict(zip(target_sources, outcomes))
+
         total_count = 0
         success_count = 0
-        
-        for source in target_sources:
-            result = await self.fetch_from_source(source, force)
-            results[source] = result
-            
+        timed_out_count = 0
+        circuit_open_count = 0
+
+        for result in outcomes:
             if result.get("success"):
                 success_count += 1
                 total_count += result.get("count", 0)
-        
+            elif result.get("timed_out"):
+                timed_out_count += 1
+            elif result.get("circuit_open"):
+                circuit_open_count += 1
+
         return {
             "success": True,
             "sources_processed": len(target_sources),
             "sources_successful": success_count,
+            "sources_timed_out": timed_out_count,
+            "sources_circuit_open": circuit_open_count,
             "total_competitions": total_count,
+            "duration_seconds": round(time.monotonic() - started, 3),
             "details": results
         }
-    
-    async def _store_competitions(
+
+    async def start_refresh_job(
         self, 
-        competitions: List[Any]
-    ) -> int:
-        """Store competitions in database."""
-        if not self.competitions_collection:
-            return 0
-        
-        count = 0
-        for comp in competitions:
+        force: bool = True,
+        sources: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Start fetch_all_sources in the background and return its job record.
+
+        Job records live in the metadata collection, so any worker can report
+        a job's status; they expire after refresh_job_ttl_hours.
+        """
+        job_id = uuid.uuid4().hex
+        now = datetime.now()
+        job = {
+            "job_id": job_id,
+            "status": "running",
+            "force": force,
+            "sources": sources or list(self.fetchers.keys()),
+            "created_at": now,
+            "finished_at": None,
+            "result": None,
+        }
+
+        if self.metadata_collection is not None:
+            await self.metadata_collection.insert_one({
+                **job,
+                "_id": f"refresh_job:{job_id}",
+                "job_expires_at": now + timedelta(hours=settings.refresh_job_ttl_hours),
+            })
+
+        task = asyncio.create_task(self._run_refresh_job(job_id, force, sources))
+        _jobs[job_id] = task
+        task.add_done_callback(lambda done: _jobs.pop(job_id, None))
+        return job
+
+    async def _run_refresh_job(
+        self, 
+        job_id: str,
+        force: bool,
+        sources: Optional[List[str]]
+    ) -> None:
+        """Run a background refresh job and record its outcome."""
+        try:
+            result = await self.fetch_all_sources(force=force, sources=sources, wait_for_lease=True)
+            fields = {"status": "completed", "result": result}
+        except Exception as e:
+            logger.error(f"Refresh job {job_id} failed: {e}")
+            fields = {"status": "failed", "error": str(e)}
+        fields["finished_at"] = datetime.now()
+
+        if self.metadata_collection is not None:
             try:
-                # Convert to dict if needed
-                if hasattr(comp, "to_dict"):
-                    comp_dict = comp.to_dict()
-                elif hasattr(comp, "dict"):
-                    comp_dict = comp.dict()
-                else:
-                    comp_dict = comp
-                
-                comp_id = comp_dict.get("id")
-                if not comp_id:
-                    logger.warning("Skipping competition without ID")
+                await self.metadata_collection.update_one(
+                    {"_id": f"refresh_job:{job_id}"},
+                    {"$set": fields}
+                )
+            except Exception as e:
+                logger.warning(f"Error recording refresh job {job_id}: {e}")
+
+    async def get_refresh_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a refresh job record by ID."""
+        if self.metadata_collection is None:
+            return None
+        return await self.metadata_collection.find_one(
+            {"_id": f"refresh_job:{job_id}"},
+            {"_id": 0, "job_expires_at": 0}
+        )
+
+    async def _fetch_with_deadline(
+        self, 
+        source: str,
+        force: bool,
+        wait_for_lease: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """Fetch a single source, giving up after source_timeout seconds."""
+        try:
+            return await asyncio.wait_for(
+                self.fetch_from_source(source, force, wait_for_lease=wait_for_lease),
+                timeout=self.source_timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Fetching from {source} timed out after {self.source_timeout}s")
+            # The shielded refresh keeps running; if it is fetching here, whichever of
+            # it and this timeout comes first records the run's one breaker outcome.
+            # A run still waiting on another worker's lease, or already finished,
+            # says nothing about the source.
+            task = _inflight.get(self._inflight_key(source, force, wait_for_lease))
+            if task is not None and task in _fetching and not task.done() and self._claim_breaker_record(task):
+                await self._record_breaker(source, False, f"Timed out after {self.source_timeout}s")
+            return {
+                "success": False,
+                "source": source,
+                "status": "timed_out",
+                "timed_out": True,
+                "error": f"Timed out after {self.source_timeout}s"
+            }
+
+    @staticmethod
+    def _claim_breaker_record(task: Optional[asyncio.Task]) -> bool:
+        """
+        Claim the right to record a shared refresh task's breaker outcome;
+        only the first claim wins. Runs outside _inflight always record.
+        """
+        if task is None or task not in _inflight.values():
+            return True
+        if task in _breaker_recorded:
+            return False
+        _breaker_recorded.add(task)
+        return True
+
+    def _get_retry_policy(self) -> RetryPolicy:
+        """Retry policy for transient upstream failures."""
+        return RetryPolicy(
+            max_attempts=max(1, settings.fetch_retry_attempts),
+            backoff_base=settings.fetch_retry_backoff_seconds,
+            max_backoff=settings.fetch_retry_max_backoff_seconds
+        )
+
+    def _get_lease_repository(self) -> Optional[LeaseRepository]:
+        """Get the refresh lease repository, if leasing is enabled."""
+        if not settings.refresh_lease_enabled or self.metadata_collection is None:
+            return None
+        return LeaseRepository(self.db)
+
+    def _get_archive(self, replay: bool = False) -> Optional[ResponseArchive]:
+        """Get the raw-response archive when archiving is enabled or replaying."""
+        if replay or settings.fetch_archive_enabled:
+            return ResponseArchive(settings.fetch_archive_path)
+        return None
+
+    def _get_validator_cache(self) -> Optional[ValidatorCache]:
+        """Get the configured HTTP validator cache for conditional requests."""
+        backend = settings.http_cache_backend.lower()
+        if backend == "mongo" and self.metadata_collection is not None:
+            return MongoValidatorCache(self.metadata_collection)
+        if backend == "file":
+            return FileValidatorCache(settings.http_cache_path)
+        return None
+
+    async def _store_stream(
+        self,
+        competitions: AsyncIterator[Any],
+        run_stats: Optional[IngestStats] = None
+    ) -> Dict[str, Any]:
+        """
+        Store competitions from an async iterator in bounded batches.
+
+        Each full batch is upserted in the background while the next one is
+        collected, with at most one write in flight, so memory stays around
+        two batches regardless of source size and the first documents are
+        stored before the source has been read to the end.
+
+        Conversion and write times and the write counts are added to run_stats.
+
+        Returns:
+            Dict with received/inserted/updated/unchanged/failed counts
+        """
+        run_stats = run_stats or IngestStats()
+        stats = {"received": 0, "inserted": 0, "updated": 0, "unchanged": 0, "failed": 0}
+        repository = CompetitionRepository(self.db) if self.competitions_collection is not None else None
+        duplicates = await self._get_duplicate_index() if repository else None
+        batch_size = max(1, settings.bulk_write_batch_size)
+
+        async def flush(documents: List[Dict[str, Any]]):
+            if duplicates is not None:
+                with run_stats.timer("dedupe"):
+                    await self._check_stored_links(repository, documents)
+            with run_stats.timer("store"):
+                result = await repository.bulk_upsert(documents, batch_size=batch_size)
+            if result["failed"]:
+                logger.warning(f"{len(result['failed'])} competitions failed to store")
+            stats["inserted"] += result["inserted"]
+            stats["updated"] += result["updated"]
+            stats["unchanged"] += result["unchanged"]
+            stats["failed"] += len(result["failed"])
+
+            # Keep the in-memory indexes in step with what was stored
+            failed_ids = {failure["id"] for failure in result["failed"]}
+            stored = [document for document in documents if document.get("id") not in failed_ids]
+            if duplicates is not None:
+                self._index_duplicates(duplicates, stored)
+            SearchService.index_documents(stored)
+
+        batch: List[Dict[str, Any]] = []
+        pending: Optional[asyncio.Task] = None
+        try:
+            async for comp in competitions:
+                stats["received"] += 1
+                if repository is None:
+                    continue
+                try:
+                    with run_stats.timer("convert"):
+                        document = self._to_document(comp)
+                except Exception as e:
+                    logger.warning(f"Error converting competition: {e}")
+                    stats["failed"] += 1
                     continue
-                
-                await self.competitions_collection.update_one(
-                    {"id": comp_id},
-                    {"$set": comp_dict},
-                    upsert=True
+
+                if duplicates is not None and document.get("id"):
+                    with run_stats.timer("dedupe"):
+                        self._link_duplicate(duplicates, document)
+                    if document.get("duplicate_of"):
+                        run_stats.count("cross_source_duplicates")
+                batch.append(document)
+
+                if len(batch) >= batch_size:
+                    if pending is not None:
+                        await pending
+                    pending = asyncio.create_task(flush(batch))
+                    batch = []
+                    # Let the write start before parsing resumes
+                    await asyncio.sleep(0)
+
+            if pending is not None:
+                await pending
+                pending = None
+            if batch:
+                await flush(batch)
+        finally:
+            # A failed or cancelled source still finishes the write already sent
+            if pending is not None:
+                await asyncio.gather(pending, return_exceptions=True)
+
+        for key in ("inserted", "updated", "unchanged", "failed"):
+            run_stats.count(key, stats[key])
+        return stats
+
+    @staticmethod
+    def _link_duplicate(duplicates: DuplicateIndex, document: Dict[str, Any]) -> None:
+        """Point a document at the record it duplicates on another source, if any."""
+        canonical = duplicates.match(
+            document["id"],
+            document.get("title"),
+            document.get("start_date"),
+            document.get("platform")
+        )
+        FetcherService._set_duplicate_of(document, canonical)
+
+    @staticmethod
+    def _set_duplicate_of(document: Dict[str, Any], canonical: Optional[str]) -> None:
+        """Set a document's duplicate_of, keeping its content hash in step."""
+        if canonical != document.get("duplicate_of"):
+            document["duplicate_of"] = canonical
+            document["content_hash"] = compute_content_hash(document)
+
+    @staticmethod
+    async def _check_stored_links(repository: CompetitionRepository, documents: List[Dict[str, Any]]) -> None:
+        """
+        Keep a batch's links one hop deep against the stored catalog, which
+        other workers may have linked since this worker's index was loaded:
+        a record others are stored as duplicates of stays canonical, and a
+        link to a record stored as a duplicate follows it to its canonical.
+        """
+        linked = [document for document in documents if document.get("duplicate_of")]
+        if not linked:
+            return
+        try:
+            canonical_ids = set(await repository.get_linked_ids([document["id"] for document in linked]))
+            targets = await repository.get_duplicate_links([document["duplicate_of"] for document in linked])
+        except Exception as e:
+            logger.warning(f"Could not check stored duplicate links, storing as matched: {e}")
+            return
+
+        for document in linked:
+            canonical = None
+            if document["id"] not in canonical_ids:
+                canonical = targets.get(document["duplicate_of"], document["duplicate_of"])
+            FetcherService._set_duplicate_of(document, None if canonical == document["id"] else canonical)
+
+    @staticmethod
+    def _index_duplicates(duplicates: DuplicateIndex, documents: List[Dict[str, Any]]) -> None:
+        """Add stored documents to the duplicate index."""
+        for document in documents:
+            if document.get("id"):
+                duplicates.add(
+                    document["id"],
+                    document.get("title"),
+                    document.get("start_date"),
+                    document.get("platform"),
+                    document.get("duplicate_of")
                 )
-                count += 1
-                
+
+    async def _get_duplicate_index(self) -> Optional[DuplicateIndex]:
+        """
+        Get the process-wide duplicate index, loading it from the catalog when
+        missing or older than dedup_index_max_age_minutes.
+        """
+        global _duplicate_index, _duplicate_index_loaded_at
+
+        if not settings.dedup_enabled:
+            return None
+
+        async with _duplicate_index_lock:
+            max_age = timedelta(minutes=settings.dedup_index_max_age_minutes)
+            if _duplicate_index is not None and datetime.now() - _duplicate_index_loaded_at < max_age:
+                return _duplicate_index
+
+            try:
+                records = await CompetitionRepository(self.db).get_dedup_records()
             except Exception as e:
-                logger.warning(f"Error storing competition: {e}")
-                continue
-        
-        return count
-    
-    async def get_source_status(self) -> Dict[str, Any]:
-        """Get status of all configured sources."""
+                logger.warning(f"Could not load duplicate index, storing without cross-source dedup: {e}")
+                return _duplicate_index
+
+            index = DuplicateIndex(
+                threshold=settings.dedup_similarity_threshold,
+                date_window_days=settings.dedup_date_window_days
+            )
+            for record in records:
+                if not record.get("id"):
+                    continue
+                index.add(
+                    record["id"],
+                    record.get("title"),
+                    record.get("start_date"),
+                    record.get("platform"),
+                    record.get("duplicate_of")
+                )
+            _duplicate_index = index
+            _duplicate_index_loaded_at = datetime.now()
+            logger.info(f"Loaded duplicate index with {len(index)} competitions")
+            return index
+
+    @staticmethod
+    def _to_document(comp: Any) -> Dict[str, Any]:
+        """Convert a competition to a document carrying its content hash."""
+        # Convert to dict if needed
+        if hasattr(comp, "to_dict"):
+            comp_dict = comp.to_dict()
+        elif hasattr(comp, "dict"):
+            comp_dict = comp.dict()
+        else:
+            comp_dict = dict(comp)
+
+        if "content_hash" not in comp_dict:
+            comp_dict["content_hash"] = compute_content_hash(comp_dict)
+        return comp_dict
+
+    async def archive_ended_competitions(self) -> Dict[str, Any]:
+        """
+        Move competitions that ended more than archive_grace_hours ago into
+        the archive collection.
+
+        Runs under the "archive" lease, so only one worker archives at a time.
+        """
+        if self.competitions_collection is None:
+            return {"success": False, "error": "Database unavailable"}
+
+        leases = self._get_lease_repository()
+        try:
+            if leases is not None and not await leases.acquire("archive", settings.refresh_lease_seconds):
+                return {"success": True, "skipped": True, "message": "Archival running on another worker"}
+
+            cutoff = datetime.now(timezone.utc) - timedelta(hours=settings.archive_grace_hours)
+            archived_ids = await CompetitionRepository(self.db).archive_ended(
+                cutoff,
+                batch_size=settings.bulk_write_batch_size
+            )
+
+            if _duplicate_index is not None:
+                for competition_id in archived_ids:
+                    _duplicate_index.remove(competition_id)
+            SearchService.remove_documents(archived_ids)
+
+            logger.info(f"Archived {len(archived_ids)} competitions that ended before {cutoff.isoformat()}")
+            return {"success": True, "archived": len(archived_ids), "cutoff": cutoff.isoformat()}
+        except Exception as e:
+            logger.error(f"Error archiving ended competitions: {e}")
+            return {"success": False, "error": str(e)}
+        finally:
+            if leases is not None:
+                try:
+                    await leases.release("archive")
+                except Exception as e:
+                    logger.warning(f"Error releasing archive lease: {e}")
+
+    async def get_source_status(self, include_history: bool = False) -> Dict[str, Any]:
+        """
+        Get status of all configured sources.
+
+        Includes each source's last run stats; include_history adds the
+        rolling run_history as well.
+        """
         status = {}
-        
+
         for source in self.fetchers.keys():
             is_fresh = await self.is_source_fresh(source)
-            
+
             # Get last update time
             metadata = None
-            if self.metadata_collection:
+            if self.metadata_collection is not None:
                 try:
                     metadata = await self.metadata_collection.find_one({"_id": source})
                 except Exception:
                     pass
-            
+
             status[source] = {
                 "is_fresh": is_fresh,
                 "last_updated": metadata.get("last_updated") if metadata else None,
-                "competition_count": metadata.get("competition_count", 0) if metadata else 0
+                "next_run_at": metadata.get("next_run_at") if metadata else None,
+                "refresh_interval_hours": settings.refresh_interval_for(source),
+                "circuit": await self.get_breaker(source),
+                "competition_count": metadata.get("competition_count", 0) if metadata else 0,
+                "last_run": metadata.get("last_run") if metadata else None
             }
-        
+            if include_history:
+                status[source]["run_history"] = metadata.get("run_history", []) if metadata else []
+
         return {
             "success": True,
             "sources": status
         }
-    
+
     def get_available_sources(self) -> List[str]:
         """Get list of available fetcher sources."""
         return list(self.fetchers.keys())
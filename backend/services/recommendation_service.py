@@ -3,8 +3,8 @@ Recommendation service - AI/ML-powered competition recommendations.
 Matches users to competitions based on profile, skills, and preferences.
 """
 from typing import Any, Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
 import logging
+import time
 
 from backend.repositories.user_repository import UserRepository
 from backend.repositories.competition_repository import CompetitionRepository
@@ -43,8 +43,8 @@ class RecommendationService:
             # Return popular competitions for new users
             return await self._get_default_recommendations(limit)
         
-        # Get all available competitions
-        all_competitions = await self.competition_repo.get_all(limit=500)
+        # Get competitions that are still open to join
+        all_competitions = await self.competition_repo.get_not_started(limit=500)
         
         if not all_competitions:
             return {
@@ -94,20 +94,9 @@ class RecommendationService:
         reasons = []
         
         # Skip past competitions
-        start_date_str = competition.get("start_date")
-        if start_date_str:
-            try:
-                if isinstance(start_date_str, str):
-                    start_date = datetime.fromisoformat(
-                        start_date_str.replace("Z", "+00:00")
-                    )
-                else:
-                    start_date = start_date_str
-                
-                if start_date < datetime.now(start_date.tzinfo if hasattr(start_date, 'tzinfo') and start_date.tzinfo else None):
-                    return 0, []
-            except (ValueError, TypeError):
-                pass
+        start_ts = competition.get("start_ts")
+        if start_ts is not None and start_ts < time.time():
+            return 0, []
         
         # Skip already saved competitions
         saved_comps = user.get("saved_competitions", [])
@@ -0,0 +1,103 @@
+"""
+Search service - In-memory competition search.
+Keeps a process-wide BM25 index (engines.search) over the live catalog,
+loaded from MongoDB on first use and updated as FetcherService stores
+competitions, so ranking a query never touches the database.
+"""
+from typing import Any, Dict, Iterable, Optional
+from datetime import datetime, timedelta
+import asyncio
+import logging
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from backend.core.config import settings
+from backend.repositories.competition_repository import CompetitionRepository
+from engines.search import SearchIndex, tokenize
+
+logger = logging.getLogger(__name__)
+
+# Search index shared by this process, and when it was loaded from the catalog
+_search_index: Optional[SearchIndex] = None
+_search_index_loaded_at: Optional[datetime] = None
+_search_index_lock = asyncio.Lock()
+
+
+class SearchService:
+    """Service for ranking competitions against a search query."""
+    
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self.db = db
+    
+    async def get_index(self) -> Optional[SearchIndex]:
+        """
+        Get the process-wide search index, loading it from the catalog when
+        missing or older than search_index_max_age_minutes.
+        
+        Returns None when the engine is disabled or has never loaded.
+        """
+        global _search_index, _search_index_loaded_at
+        
+        if not settings.search_engine_enabled or self.db is None:
+            return None
+        
+        async with _search_index_lock:
+            max_age = timedelta(minutes=settings.search_index_max_age_minutes)
+            if _search_index is not None and datetime.now() - _search_index_loaded_at < max_age:
+                return _search_index
+            
+            try:
+                records = await CompetitionRepository(self.db).get_search_records()
+            except Exception as e:
+                logger.warning(f"Could not load search index: {e}")
+                return _search_index
+            
+            index = SearchIndex()
+            index.add_many((record["id"], record) for record in records if record.get("id"))
+            _search_index = index
+            _search_index_loaded_at = datetime.now()
+            logger.info(f"Loaded search index with {len(index)} competitions")
+            return index
+    
+    async def rank(self, query: str) -> Optional[Dict[str, float]]:
+        """
+        Relevance scores of the competitions matching a query, best first.
+        
+        Returns None when the engine is unavailable, or the query has no
+        searchable words (e.g. only stopwords), so callers can fall back to
+        database search.
+        """
+        if not tokenize(query):
+            return None
+        index = await self.get_index()
+        if index is None:
+            return None
+        return dict(index.search(query, limit=settings.search_max_results))
+    
+    @staticmethod
+    def index_documents(documents: Iterable[Dict[str, Any]]) -> None:
+        """
+        Apply stored competition documents to a loaded index.
+        
+        Records linked to another source's competition are dropped, like in
+        listings. Before the index is loaded there is nothing to update: the
+        first search loads the stored catalog.
+        """
+        if _search_index is None:
+            return
+        for document in documents:
+            competition_id = document.get("id")
+            if not competition_id:
+                continue
+            if document.get("duplicate_of"):
+                _search_index.remove(competition_id)
+            else:
+                _search_index.add(competition_id, document)
+    
+    @staticmethod
+    def remove_documents(competition_ids: Iterable[str]) -> None:
+        """Drop competitions (e.g. archived ones) from a loaded index."""
+        if _search_index is None:
+            return
+        for competition_id in competition_ids:
+            _search_index.remove(competition_id)
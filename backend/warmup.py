@@ -0,0 +1,92 @@
+"""
+Startup warm-up and readiness state.
+The initial competition refresh runs as a background task so the app can
+serve as soon as MongoDB is connected, instead of blocking in the lifespan.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from backend.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Global warm-up state
+_task: Optional[asyncio.Task] = None
+_state: Dict[str, Any] = {"status": "pending", "started_at": None, "finished_at": None, "error": None}
+
+
+async def _run_warmup(fetcher_service) -> None:
+    """Refresh stale sources and record the outcome."""
+    _state.update(status="running", started_at=datetime.utcnow().isoformat())
+    try:
+        summary = await fetcher_service.fetch_all_sources(force=False)
+        _state.update(status="completed", summary={
+            key: summary.get(key)
+            for key in ("sources_processed", "sources_successful", "sources_timed_out", "duration_seconds")
+        })
+    except asyncio.CancelledError:
+        _state.update(status="cancelled")
+        raise
+    except Exception as e:
+        logger.error(f"Warm-up refresh failed: {e}")
+        _state.update(status="failed", error=str(e))
+    finally:
+        _state["finished_at"] = datetime.utcnow().isoformat()
+
+
+def mark_warmup_failed(error: Exception) -> None:
+    """Record a warm-up that could not be started, so readiness doesn't wait on it."""
+    if _state["status"] != "pending":
+        return
+    now = datetime.utcnow().isoformat()
+    _state.update(status="failed", started_at=_state["started_at"] or now, finished_at=now, error=str(error))
+
+
+def start_warmup(fetcher_service) -> asyncio.Task:
+    """Start the warm-up refresh in the background."""
+    global _task
+    
+    if _task is not None and not _task.done():
+        return _task
+    
+    _task = asyncio.create_task(_run_warmup(fetcher_service), name="startup-warmup")
+    logger.info("Warm-up refresh started in background")
+    return _task
+
+
+async def stop_warmup():
+    """Cancel the warm-up refresh if it is still running."""
+    global _task
+    if _task and not _task.done():
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        logger.info("Warm-up refresh cancelled")
+    _task = None
+
+
+def get_warmup_status() -> Dict[str, Any]:
+    """Get a copy of the warm-up state."""
+    return dict(_state)
+
+
+def is_warmup_finished() -> bool:
+    """True once the warm-up refresh has ended, successfully or not."""
+    return _state["status"] in ("completed", "failed", "cancelled")
+
+
+def is_ready(db_connected: bool) -> bool:
+    """
+    Readiness to take traffic.
+    
+    With READINESS_SERVE_STALE the instance is ready as soon as MongoDB is
+    connected and serves whatever data is stored while warm-up runs;
+    otherwise it waits for the warm-up refresh to finish.
+    """
+    if not db_connected:
+        return False
+    return settings.readiness_serve_stale or is_warmup_finished()
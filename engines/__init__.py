@@ -1 +1,10 @@
 # This file makes the engines directory a Python package
+from .dedup import DuplicateIndex, normalize_title
+from .search import SearchIndex, tokenize
+
+__all__ = [
+    'DuplicateIndex',
+    'SearchIndex',
+    'normalize_title',
+    'tokenize'
+]
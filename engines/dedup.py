@@ -0,0 +1,253 @@
+"""
+Cross-source duplicate detection.
+Finds the same competition listed by different sources under slightly
+different titles: title shingles are MinHashed and blocked with LSH, and
+candidates are confirmed by Jaccard similarity and a start-date window.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+import random
+import re
+import unicodedata
+import zlib
+
+# Words that vary between listings of the same event without telling events apart
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'at', 'for', 'in', 'of', 'on', 'the',
+    'annual', 'edition', 'online', 'virtual',
+    'challenge', 'competition', 'contest', 'hackathon',
+})
+
+_YEAR = re.compile(r'\b(?:19|20)\d{2}\b')
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+# Mersenne prime for the MinHash permutations
+_PRIME = (1 << 61) - 1
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase, strip accents, years, punctuation and filler words."""
+    text = unicodedata.normalize('NFKD', title or '').encode('ascii', 'ignore').decode('ascii').lower()
+    tokens = _NON_ALNUM.sub(' ', _YEAR.sub(' ', text)).split()
+    kept = [token for token in tokens if token not in STOPWORDS]
+    # A title made only of filler words still has to match something
+    return ' '.join(kept or tokens)
+
+
+def shingles(text: str, k: int = 3) -> FrozenSet[str]:
+    """Character k-grams of a normalized title."""
+    if len(text) <= k:
+        return frozenset([text]) if text else frozenset()
+    return frozenset(text[i:i + k] for i in range(len(text) - k + 1))
+
+
+def title_shingles(title: str) -> FrozenSet[str]:
+    """Shingles of a title, ignoring spacing ("Cal Hacks" == "CalHacks")."""
+    return shingles(normalize_title(title).replace(' ', ''))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def parse_date(value: Any) -> Optional[datetime]:
+    """Naive datetime from a datetime or ISO string, or None."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    return value.replace(tzinfo=None)
+
+
+class MinHasher:
+    """MinHash signatures over string shingles, stable across processes."""
+    
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        rng = random.Random(seed)
+        self.permutations = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME))
+            for _ in range(num_perm)
+        ]
+    
+    def signature(self, items: Iterable[str]) -> Tuple[int, ...]:
+        hashes = [zlib.crc32(item.encode('utf-8')) for item in items]
+        if not hashes:
+            return tuple(_PRIME for _ in self.permutations)
+        return tuple(
+            min((a * h + b) % _PRIME for h in hashes)
+            for a, b in self.permutations
+        )
+
+
+class LSHIndex:
+    """Banded locality-sensitive hashing over MinHash signatures."""
+    
+    def __init__(self, bands: int, rows: int):
+        self.bands = bands
+        self.rows = rows
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], Set[str]] = {}
+    
+    def _keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+        return [
+            (band, signature[band * self.rows:(band + 1) * self.rows])
+            for band in range(self.bands)
+        ]
+    
+    def insert(self, key: str, signature: Tuple[int, ...]) -> None:
+        for bucket in self._keys(signature):
+            self._buckets.setdefault(bucket, set()).add(key)
+    
+    def remove(self, key: str, signature: Tuple[int, ...]) -> None:
+        for bucket in self._keys(signature):
+            members = self._buckets.get(bucket)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self._buckets[bucket]
+    
+    def query(self, signature: Tuple[int, ...]) -> Set[str]:
+        """Keys sharing at least one band with the signature"""
+        candidates: Set[str] = set()
+        for bucket in self._keys(signature):
+            candidates |= self._buckets.get(bucket, set())
+        return candidates
+
+
+@dataclass
+class _Entry:
+    shingles: FrozenSet[str]
+    signature: Tuple[int, ...]
+    start_date: Optional[datetime]
+    source: Optional[str]
+    duplicate_of: Optional[str]
+
+
+class DuplicateIndex:
+    """
+    Incremental index of catalog records for cross-source duplicate detection.
+    
+    Records from the same source are never matched with each other: within
+    a source, fetchers deduplicate on their own keys. A match needs a title
+    similarity of at least threshold and start dates within
+    date_window_days; when either date is missing, a near-identical title
+    (undated_threshold) is required instead.
+    """
+    
+    def __init__(
+        self,
+        threshold: float = 0.6,
+        date_window_days: float = 3,
+        undated_threshold: float = 0.9,
+        num_perm: int = 64,
+        bands: int = 16
+    ):
+        self.threshold = threshold
+        self.date_window = timedelta(days=date_window_days)
+        self.undated_threshold = undated_threshold
+        self.hasher = MinHasher(num_perm)
+        self.lsh = LSHIndex(bands, num_perm // bands)
+        self._entries: Dict[str, _Entry] = {}
+        # IDs of the records linked to each canonical record
+        self._linked: Dict[str, Set[str]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self._entries
+    
+    def add(
+        self,
+        record_id: str,
+        title: str,
+        start_date: Any,
+        source: Optional[str],
+        duplicate_of: Optional[str] = None
+    ) -> None:
+        """Index a record as is, e.g. when loading the stored catalog or once it is stored."""
+        self.remove(record_id)
+        grams = title_shingles(title)
+        entry = _Entry(grams, self.hasher.signature(grams), parse_date(start_date), source, duplicate_of)
+        self._entries[record_id] = entry
+        self.lsh.insert(record_id, entry.signature)
+        if duplicate_of is not None:
+            self._linked.setdefault(duplicate_of, set()).add(record_id)
+    
+    def remove(self, record_id: str) -> None:
+        entry = self._entries.pop(record_id, None)
+        if entry is None:
+            return
+        self.lsh.remove(record_id, entry.signature)
+        if entry.duplicate_of is not None:
+            linked = self._linked.get(entry.duplicate_of)
+            if linked is not None:
+                linked.discard(record_id)
+                if not linked:
+                    del self._linked[entry.duplicate_of]
+    
+    def has_duplicates(self, record_id: str) -> bool:
+        """True if indexed records are linked to this one."""
+        return bool(self._linked.get(record_id))
+    
+    def find(
+        self,
+        title: str,
+        start_date: Any,
+        source: Optional[str],
+        exclude_id: Optional[str] = None
+    ) -> Optional[str]:
+        """ID of the best-matching record from another source, or None."""
+        grams = title_shingles(title)
+        if not grams:
+            return None
+        start = parse_date(start_date)
+        
+        best_id, best_score = None, 0.0
+        for candidate_id in self.lsh.query(self.hasher.signature(grams)):
+            if candidate_id == exclude_id:
+                continue
+            candidate = self._entries[candidate_id]
+            if source is not None and candidate.source == source:
+                continue
+            
+            if start is not None and candidate.start_date is not None:
+                if abs(start - candidate.start_date) > self.date_window:
+                    continue
+                required = self.threshold
+            else:
+                required = self.undated_threshold
+            
+            score = jaccard(grams, candidate.shingles)
+            if score >= required and (score, candidate_id) > (best_score, best_id or ''):
+                best_id, best_score = candidate_id, score
+        return best_id
+    
+    def match(
+        self,
+        record_id: str,
+        title: str,
+        start_date: Any,
+        source: Optional[str]
+    ) -> Optional[str]:
+        """
+        Canonical record an ingested record duplicates, or None if it is
+        canonical itself. The index is left as is: add the record once it
+        has been stored.
+        
+        Duplicates always point at the canonical record, never at another
+        duplicate, and a record others are linked to stays canonical, so
+        links are never more than one hop.
+        """
+        if self.has_duplicates(record_id):
+            return None
+        match = self.find(title, start_date, source, exclude_id=record_id)
+        if match is None:
+            return None
+        canonical = self._entries[match].duplicate_of or match
+        return None if canonical == record_id else canonical
@@ -0,0 +1,199 @@
+"""
+In-memory full-text search over the competition catalog.
+An inverted index maps each token to the records containing it, with
+field-weighted term frequencies, and queries are ranked with BM25. The
+last query word also matches as a prefix, for search-as-you-type.
+"""
+from bisect import bisect_left
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import heapq
+import math
+import re
+import unicodedata
+
+# Fields indexed, and how much a hit in each counts towards a record's term frequency
+FIELD_WEIGHTS = {
+    'title': 3.0,
+    'tags': 2.0,
+    'platform': 2.0,
+    'skills_required': 1.5,
+    'description': 1.0,
+}
+
+STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in',
+    'is', 'it', 'of', 'on', 'or', 'the', 'to', 'with',
+})
+
+_ASCII_TOKEN = re.compile(r'[a-z0-9]+')
+
+# Accents are dropped from Latin letters only; other scripts need their combining marks
+_LATIN_END = '\u024f'
+
+# Shortest last word expanded as a prefix, and how many vocabulary terms it may expand to
+_MIN_PREFIX = 2
+_MAX_PREFIX_TERMS = 20
+
+
+def _words(text: str) -> Iterator[str]:
+    """Runs of letters, digits and their combining marks, in any script."""
+    word: List[str] = []
+    for char in text:
+        if char.isalnum() or unicodedata.category(char).startswith('M'):
+            word.append(char)
+        elif word:
+            yield ''.join(word)
+            word = []
+    if word:
+        yield ''.join(word)
+
+
+def _fold(text: str) -> str:
+    """Case-fold a text and strip accents from Latin letters ("Café" -> "cafe")."""
+    kept: List[str] = []
+    base = ''
+    for char in unicodedata.normalize('NFKD', text):
+        if unicodedata.combining(char):
+            if base > _LATIN_END:
+                kept.append(char)
+        else:
+            base = char
+            kept.append(char)
+    return unicodedata.normalize('NFC', ''.join(kept)).casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    """Case-folded word tokens of a text in any script, without stopwords."""
+    text = text or ''
+    if text.isascii():
+        words = _ASCII_TOKEN.findall(text.lower())
+    else:
+        words = _words(_fold(text))
+    return [word for word in words if word not in STOPWORDS]
+
+
+def _field_text(value: Any) -> str:
+    if isinstance(value, (list, tuple, set)):
+        return ' '.join(str(item) for item in value if item)
+    return str(value) if value else ''
+
+
+class SearchIndex:
+    """
+    BM25-ranked inverted index, updated one record at a time.
+    
+    Term frequencies are weighted per field (FIELD_WEIGHTS), so a title
+    hit outranks a description hit, and document length is the weighted
+    token count used by BM25's length normalization.
+    """
+    
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        field_weights: Optional[Dict[str, float]] = None
+    ):
+        self.k1 = k1
+        self.b = b
+        self.field_weights = field_weights or FIELD_WEIGHTS
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._terms: Dict[str, Dict[str, float]] = {}
+        self._lengths: Dict[str, float] = {}
+        self._total_length = 0.0
+        # Sorted vocabulary for prefix lookups, rebuilt lazily after changes
+        self._vocabulary: Optional[List[str]] = None
+    
+    def __len__(self) -> int:
+        return len(self._lengths)
+    
+    def __contains__(self, record_id: str) -> bool:
+        return record_id in self._lengths
+    
+    def add(self, record_id: str, record: Dict[str, Any]) -> None:
+        """Index a record, replacing what was indexed under its ID before."""
+        self.remove(record_id)
+        
+        terms: Dict[str, float] = {}
+        for field, weight in self.field_weights.items():
+            for token in tokenize(_field_text(record.get(field))):
+                terms[token] = terms.get(token, 0.0) + weight
+        
+        for term, frequency in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._vocabulary = None
+            postings[record_id] = frequency
+        
+        length = sum(terms.values())
+        self._terms[record_id] = terms
+        self._lengths[record_id] = length
+        self._total_length += length
+    
+    def add_many(self, records: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        for record_id, record in records:
+            self.add(record_id, record)
+    
+    def remove(self, record_id: str) -> None:
+        terms = self._terms.pop(record_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            postings = self._postings[term]
+            del postings[record_id]
+            if not postings:
+                del self._postings[term]
+                self._vocabulary = None
+        self._total_length -= self._lengths.pop(record_id)
+    
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        """The first vocabulary terms, in sorted order, that start with prefix."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        matches = []
+        position = bisect_left(self._vocabulary, prefix)
+        while (
+            len(matches) < _MAX_PREFIX_TERMS
+            and position < len(self._vocabulary)
+            and self._vocabulary[position].startswith(prefix)
+        ):
+            matches.append(self._vocabulary[position])
+            position += 1
+        return matches
+    
+    def _query_terms(self, query: str) -> Dict[str, float]:
+        """Query terms and their weights; prefix expansions of the last word weigh less."""
+        tokens = tokenize(query)
+        terms = dict.fromkeys(tokens, 1.0)
+        if tokens and len(tokens[-1]) >= _MIN_PREFIX and query == query.rstrip():
+            for term in self._expand_prefix(tokens[-1]):
+                terms.setdefault(term, 0.5)
+        return terms
+    
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """(record ID, score) pairs matching any query term, best first."""
+        if not self._lengths:
+            return []
+        
+        count = len(self._lengths)
+        average_length = self._total_length / count or 1.0
+        lengths = self._lengths
+        # BM25 length normalization, k1 * (1 - b + b * length / average_length), split into parts
+        base = self.k1 * (1 - self.b)
+        per_length = self.k1 * self.b / average_length
+        
+        scores: Dict[str, float] = {}
+        for term, weight in self._query_terms(query).items():
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            term_weight = weight * idf * (self.k1 + 1)
+            for record_id, frequency in postings.items():
+                score = term_weight * frequency / (frequency + base + per_length * lengths[record_id])
+                scores[record_id] = scores.get(record_id, 0.0) + score
+        
+        if limit is not None and limit < len(scores):
+            return heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+        return sorted(scores.items(), key=itemgetter(1), reverse=True)
@@ -1,11 +1,30 @@
 # This file makes the fetchers directory a Python package
 # Initialize the fetchers package
+from .base_fetcher import BaseFetcher, AsyncBaseFetcher, SyncFetcherAdapter, as_async_fetcher, shutdown_parse_executor
+from .html_parsing import select_cards
+from .archive import ResponseArchive
+from .http_cache import NotModified, ValidatorCache, FileValidatorCache, MongoValidatorCache
+from .session import FetchSession
+from .stats import IngestStats
 from .hackathons.hackalist import HackalistFetcher
 from .coding_contests.codeforces import CodeforcesFetcher
 from .data_science.kaggle import KaggleFetcher
 from .corporate.hackerrank import HackerRankFetcher
 
 __all__ = [
+    'BaseFetcher',
+    'AsyncBaseFetcher',
+    'SyncFetcherAdapter',
+    'as_async_fetcher',
+    'shutdown_parse_executor',
+    'select_cards',
+    'ResponseArchive',
+    'NotModified',
+    'ValidatorCache',
+    'FileValidatorCache',
+    'MongoValidatorCache',
+    'FetchSession',
+    'IngestStats',
     'HackalistFetcher',
     'CodeforcesFetcher',
     'KaggleFetcher',
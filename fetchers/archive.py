@@ -0,0 +1,79 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import gzip
+import hashlib
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+class ResponseArchive:
+    """Content-addressed, gzip-compressed archive of raw fetcher responses.
+    
+    Layout under root:
+        objects/<sha256[:2]>/<sha256>.gz      response bodies, stored once per content
+        runs/<source>/<run_id>.json            manifest of one run: URL -> body digest
+    
+    Identical payloads across runs share one object, so archiving an
+    unchanged source costs only a small manifest.
+    """
+    
+    def __init__(self, root: str):
+        self.root = root
+    
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.root, 'objects', digest[:2], f"{digest}.gz")
+    
+    def _runs_dir(self, source: str) -> str:
+        return os.path.join(self.root, 'runs', source.lower())
+    
+    def put(self, body: bytes) -> str:
+        """Store a response body and return its SHA-256 digest"""
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with gzip.open(tmp_path, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+        return digest
+    
+    def get(self, digest: str) -> bytes:
+        """Load a response body by digest"""
+        with gzip.open(self._object_path(digest), 'rb') as f:
+            return f.read()
+    
+    def save_run(self, source: str, responses: Dict[str, Dict[str, Any]]) -> str:
+        """Write the manifest for one run and return its run ID"""
+        fetched_at = datetime.utcnow()
+        run_id = fetched_at.strftime('%Y%m%dT%H%M%S%fZ')
+        runs_dir = self._runs_dir(source)
+        os.makedirs(runs_dir, exist_ok=True)
+        manifest = {
+            'source': source,
+            'run_id': run_id,
+            'fetched_at': fetched_at.isoformat(),
+            'responses': responses,
+        }
+        with open(os.path.join(runs_dir, f"{run_id}.json"), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        return run_id
+    
+    def list_runs(self, source: str) -> List[str]:
+        """Run IDs archived for a source, oldest first"""
+        runs_dir = self._runs_dir(source)
+        if not os.path.isdir(runs_dir):
+            return []
+        return sorted(name[:-len('.json')] for name in os.listdir(runs_dir) if name.endswith('.json'))
+    
+    def load_run(self, source: str, run_id: Optional[str] = None) -> Dict[str, Any]:
+        """Load a run manifest; defaults to the most recent run"""
+        if run_id is None:
+            runs = self.list_runs(source)
+            if not runs:
+                raise LookupError(f"No archived runs for {source} in {self.root}")
+            run_id = runs[-1]
+        with open(os.path.join(self._runs_dir(source), f"{run_id}.json"), 'r', encoding='utf-8') as f:
+            return json.load(f)
@@ -1,14 +1,51 @@
 from abc import ABC, abstractmethod
-from typing import List
-from models.competition import Competition
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import timezone, tzinfo
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+from models.competition import DATE_FIELDS, Competition, to_utc
+from .archive import ResponseArchive
+from .html_parsing import payload_size
+from .http_cache import NotModified, ValidatorCache
+from .retry import RetryPolicy
+from .session import FetchSession
+from .stats import IngestStats
+import asyncio
+import hashlib
+import httpx
 import logging
+import multiprocessing
+import pickle
+import re
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def canonical_url(url: str) -> str:
+    """Normalize a URL for identity: lowercase host, no query/fragment/trailing slash"""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip('/')
+    return urlunsplit((parts.scheme.lower() or 'https', parts.netloc.lower(), path, '', ''))
+
+def make_competition_id(prefix: str, *parts: Any) -> str:
+    """Build a deterministic competition ID from a source prefix and identifying parts.
+    
+    Unlike hash(), the digest is identical across processes and restarts, so
+    re-fetching the same competition always upserts the same document.
+    """
+    normalized = [re.sub(r'\s+', ' ', str(part)).strip().lower() for part in parts if part]
+    digest = hashlib.sha1('|'.join([prefix, *normalized]).encode('utf-8')).hexdigest()[:16]
+    return f"{prefix}_{digest}"
+
 class BaseFetcher(ABC):
     """Base class for all competition fetchers"""
     
+    # Timezone of the naive datetimes this fetcher's parse produces
+    source_timezone: tzinfo = timezone.utc
+    
     def __init__(self, source_name: str):
         self.source_name = source_name
     
@@ -22,33 +59,259 @@ class BaseFetcher(ABC):
         """Parse raw data into Competition objects"""
         pass
     
+    def iter_parse(self, data: Any) -> Iterator[Competition]:
+        """Parse raw data lazily; fetchers that can parse item by item override this"""
+        yield from self.parse(data)
+    
+    def normalize_competition(self, comp: Competition) -> Competition:
+        """Convert every date to timezone-aware UTC, reading naive ones in source_timezone"""
+        for field in DATE_FIELDS:
+            value = getattr(comp, field, None)
+            if value is not None:
+                setattr(comp, field, to_utc(value, self.source_timezone))
+        return comp
+    
     def validate_competition(self, comp: Competition) -> bool:
         """Validate competition data"""
         required_fields = ['title', 'start_date', 'link']
         return all(hasattr(comp, field) and getattr(comp, field) for field in required_fields)
     
+    def dedupe_key(self, comp: Competition) -> Any:
+        """Key identifying duplicate competitions within one run"""
+        # Use title + start_date as unique key
+        return (comp.title, str(comp.start_date))
+    
     def deduplicate(self, competitions: List[Competition]) -> List[Competition]:
         """Remove duplicate competitions"""
+        return list(self.iter_unique(competitions))
+    
+    def iter_unique(self, competitions: Iterable[Competition]) -> Iterator[Competition]:
+        """Yield competitions as they arrive, skipping duplicates"""
         seen = set()
-        unique = []
         for comp in competitions:
-            # Use title + start_date as unique key
-            key = (comp.title, str(comp.start_date))
+            key = self.dedupe_key(comp)
             if key not in seen:
                 seen.add(key)
-                unique.append(comp)
-        return unique
+                yield comp
     
     def run(self) -> List[Competition]:
         """Execute full fetch-parse-validate pipeline"""
         try:
             logger.info(f"Fetching from {self.source_name}...")
             data = self.fetch()
-            competitions = self.parse(data)
-            valid_competitions = [c for c in competitions if self.validate_competition(c)]
-            unique_competitions = self.deduplicate(valid_competitions)
+            competitions = (self.normalize_competition(c) for c in self.iter_parse(data))
+            unique_competitions = list(self.iter_unique(c for c in competitions if self.validate_competition(c)))
             logger.info(f"Successfully fetched {len(unique_competitions)} competitions from {self.source_name}")
             return unique_competitions
         except Exception as e:
             logger.error(f"Error fetching from {self.source_name}: {str(e)}")
             return []
+
+
+class AsyncBaseFetcher(BaseFetcher):
+    """Base class for fetchers that run natively on asyncio.
+    
+    Network access goes through a pooled httpx.AsyncClient owned by the
+    application lifespan; parse, validation and deduplication stay synchronous.
+    Unlike BaseFetcher.run, network errors are raised so callers can report them.
+    """
+    
+    # Default headers sent with every request made by this fetcher
+    headers: Dict[str, str] = {}
+    
+    # Payloads at least this large (in characters) are parsed in a worker
+    # process so the event loop and GIL stay free; None always parses inline
+    process_parse_threshold: Optional[int] = None
+    
+    @abstractmethod
+    async def fetch(self, session: FetchSession) -> Any:
+        """Fetch raw data from source using the given session"""
+        pass
+    
+    def open_session(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        validators: Optional[ValidatorCache] = None,
+        archive: Optional[ResponseArchive] = None,
+        replay: bool = False,
+        run_id: Optional[str] = None,
+        retry: Optional[RetryPolicy] = None,
+        stats: Optional[IngestStats] = None
+    ) -> FetchSession:
+        """Create a session for one run; use it as an async context manager.
+        
+        With an archive, responses are recorded; with replay=True they are
+        instead served from the archived run (latest unless run_id is given).
+        """
+        return FetchSession(
+            client,
+            self.source_name,
+            headers=self.headers,
+            validators=validators,
+            archive=archive,
+            replay=replay,
+            run_id=run_id,
+            retry=retry,
+            stats=stats
+        )
+    
+    async def run_session(self, session: FetchSession) -> List[Competition]:
+        """Execute full fetch-parse-validate pipeline within an open session.
+        
+        Raises NotModified when the fetcher's conditional requests all came back 304.
+        """
+        return [comp async for comp in self.iter_competitions(session)]
+    
+    async def iter_competitions(self, session: FetchSession) -> AsyncIterator[Competition]:
+        """Yield normalized, valid, deduplicated competitions as soon as each is parsed.
+        
+        Lets callers store results in batches while the source is still being
+        read. Raises NotModified like run_session.
+        """
+        logger.info(f"Fetching from {self.source_name}...")
+        stats = session.stats
+        seen = set()
+        try:
+            async for comp in self.iter_parsed(session):
+                stats.count('parsed')
+                with stats.timer('normalize'):
+                    comp = self.normalize_competition(comp)
+                with stats.timer('validate'):
+                    valid = self.validate_competition(comp)
+                if not valid:
+                    stats.count('rejected')
+                    continue
+                with stats.timer('dedupe'):
+                    key = self.dedupe_key(comp)
+                    duplicate = key in seen
+                    seen.add(key)
+                if duplicate:
+                    stats.count('duplicates')
+                    continue
+                yield comp
+        except NotModified:
+            logger.info(f"{self.source_name} unchanged upstream, skipping parse")
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching from {self.source_name}: {str(e)}")
+            raise
+        logger.info(f"Successfully fetched {len(seen)} competitions from {self.source_name}")
+        
+    async def iter_parsed(self, session: FetchSession) -> AsyncIterator[Competition]:
+        """Fetch and parse, yielding competitions in source order.
+        
+        Payloads above process_parse_threshold are parsed whole in the worker
+        pool; smaller ones are parsed lazily with iter_parse. Fetchers that can
+        parse while downloading override this.
+        """
+        stats = session.stats
+        with stats.timer('fetch'):
+            data = await self.fetch(session)
+        if self.process_parse_threshold is not None and payload_size(data) >= self.process_parse_threshold:
+            with stats.timer('parse'):
+                competitions = await self.parse_async(data)
+        else:
+            competitions = stats.timed(self.iter_parse(data), 'parse')
+        for comp in competitions:
+            yield comp
+    
+    async def parse_async(self, data: Any) -> List[Competition]:
+        """Parse data, offloading large payloads to the parse process pool"""
+        if self.process_parse_threshold is None or payload_size(data) < self.process_parse_threshold:
+            return self.parse(data)
+        
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(_get_parse_executor(), self.parse, data)
+        except (BrokenProcessPool, pickle.PicklingError) as e:
+            logger.warning(f"{self.source_name}: parse pool unavailable ({e}), parsing inline")
+            shutdown_parse_executor()
+            return self.parse(data)
+    
+    async def run(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        archive: Optional[ResponseArchive] = None,
+        replay: bool = False,
+        run_id: Optional[str] = None
+    ) -> List[Competition]:
+        """Execute full fetch-parse-validate pipeline on the event loop.
+        
+        With replay=True, parses an archived run instead of hitting the network.
+        """
+        async with self.open_session(client, archive=archive, replay=replay, run_id=run_id) as session:
+            return await self.run_session(session)
+
+
+# Dedicated pool for legacy blocking fetchers so they never occupy the loop's default executor
+_sync_executor: Optional[ThreadPoolExecutor] = None
+
+def _get_sync_executor() -> ThreadPoolExecutor:
+    global _sync_executor
+    if _sync_executor is None:
+        _sync_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sync-fetcher")
+    return _sync_executor
+
+# Worker processes for CPU-heavy parsing of large pages. Spawned rather than
+# forked: the server process runs threads (Motor, the sync pool) that fork would copy mid-flight.
+_parse_executor: Optional[ProcessPoolExecutor] = None
+
+def _get_parse_executor() -> ProcessPoolExecutor:
+    global _parse_executor
+    if _parse_executor is None:
+        _parse_executor = ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('spawn'))
+    return _parse_executor
+
+def shutdown_parse_executor() -> None:
+    """Stop the parse worker processes, if any were started"""
+    global _parse_executor
+    if _parse_executor is not None:
+        _parse_executor.shutdown(wait=False, cancel_futures=True)
+        _parse_executor = None
+
+
+class SyncFetcherAdapter(AsyncBaseFetcher):
+    """Adapts a blocking BaseFetcher to the AsyncBaseFetcher interface"""
+    
+    def __init__(self, fetcher: BaseFetcher):
+        super().__init__(fetcher.source_name)
+        self.fetcher = fetcher
+    
+    async def fetch(self, session: FetchSession) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_sync_executor(), self.fetcher.fetch)
+    
+    def parse(self, data: Any) -> List[Competition]:
+        return self.fetcher.parse(data)
+    
+    def validate_competition(self, comp: Competition) -> bool:
+        return self.fetcher.validate_competition(comp)
+    
+    def normalize_competition(self, comp: Competition) -> Competition:
+        return self.fetcher.normalize_competition(comp)
+    
+    def dedupe_key(self, comp: Competition) -> Any:
+        return self.fetcher.dedupe_key(comp)
+    
+    def deduplicate(self, competitions: List[Competition]) -> List[Competition]:
+        return self.fetcher.deduplicate(competitions)
+    
+    async def run_session(self, session: FetchSession) -> List[Competition]:
+        """Run the wrapped fetcher's own pipeline off the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_sync_executor(), self.fetcher.run)
+
+    async def iter_competitions(self, session: FetchSession) -> AsyncIterator[Competition]:
+        # The wrapped pipeline is one blocking call, so its time is all reported as fetch
+        with session.stats.timer('fetch'):
+            competitions = await self.run_session(session)
+        session.stats.count('parsed', len(competitions))
+        for comp in competitions:
+            yield comp
+
+
+def as_async_fetcher(fetcher: BaseFetcher) -> AsyncBaseFetcher:
+    """Return fetcher unchanged if it is async, otherwise wrap it in an adapter"""
+    if isinstance(fetcher, AsyncBaseFetcher):
+        return fetcher
+    return SyncFetcherAdapter(fetcher)
@@ -0,0 +1,72 @@
+"""
+Parse-time benchmark over archived fetcher responses.
+
+Replays the latest (or given) archived run of an HTML source and parses it
+with each parser mode, reporting median wall time and peak Python heap:
+
+    python -m fetchers.benchmark_parse hackerrank --archive .cache/fetch_archive
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+
+from fetchers import ResponseArchive, HackerRankFetcher, HackalistFetcher
+
+FETCHER_CLASSES = {
+    "hackerrank": HackerRankFetcher,
+    "hackalist": HackalistFetcher,
+}
+
+# (label, parser, strain)
+MODES = [
+    ("html.parser, full tree", "html.parser", False),
+    ("lxml, full tree", "lxml", False),
+    ("lxml + SoupStrainer", "lxml", True),
+]
+
+
+async def load_payload(fetcher, archive: ResponseArchive, run_id=None):
+    """Raw payload exactly as fetch() returns it, served from the archive"""
+    async with fetcher.open_session(archive=archive, replay=True, run_id=run_id) as session:
+        return await fetcher.fetch(session)
+
+
+def measure(fetcher, payload, repeat: int):
+    """Median parse time in ms, peak traced memory in KiB and card count"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fetcher.parse(payload)
+        timings.append((time.perf_counter() - started) * 1000)
+    
+    tracemalloc.start()
+    competitions = fetcher.parse(payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak / 1024, len(competitions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML parsing over archived responses")
+    parser.add_argument("source", choices=sorted(FETCHER_CLASSES))
+    parser.add_argument("--archive", default=".cache/fetch_archive", help="Archive root directory")
+    parser.add_argument("--run-id", default=None, help="Run to benchmark (default: latest)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed parses per mode")
+    args = parser.parse_args()
+    
+    fetcher = FETCHER_CLASSES[args.source]()
+    payload = asyncio.run(load_payload(fetcher, ResponseArchive(args.archive), args.run_id))
+    size = sum(len(page) for page in payload) if isinstance(payload, list) else len(payload)
+    print(f"{fetcher.source_name}: {size / 1024:.0f} KiB of HTML, {args.repeat} runs per mode")
+    
+    for label, html_parser, strain in MODES:
+        fetcher.html_parser = html_parser
+        fetcher.strain_html = strain
+        median_ms, peak_kib, count = measure(fetcher, payload, args.repeat)
+        print(f"  {label:<24} {median_ms:9.1f} ms  peak {peak_kib:9.0f} KiB  {count} competitions")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,86 +1,118 @@
-import requests
-from datetime import datetime
-from typing import List, Dict, Any
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 from models.competition import Competition, CompetitionCategory, DifficultyLevel
-from ..base_fetcher import BaseFetcher
+from ..base_fetcher import AsyncBaseFetcher
+from ..http_cache import NotModified
+from ..session import FetchSession
+from ..streaming import iter_json_array
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
-class CodeforcesFetcher(BaseFetcher):
+# contest.list objects are flat, so these byte patterns identify upcoming CF rounds without decoding
+_UPCOMING_PHASE = re.compile(rb'"phase"\s*:\s*"BEFORE"')
+_CF_TYPE = re.compile(rb'"type"\s*:\s*"CF"')
+
+def _is_upcoming_cf_contest(raw: bytes) -> bool:
+    return _UPCOMING_PHASE.search(raw) is not None and _CF_TYPE.search(raw) is not None
+
+class CodeforcesFetcher(AsyncBaseFetcher):
     """Fetches coding contests from Codeforces API"""
     
     def __init__(self):
         super().__init__("Codeforces")
         self.base_url = "https://codeforces.com/api"
-        self.session = requests.Session()
     
-    def fetch(self) -> List[Dict[str, Any]]:
-        """Fetch contests from Codeforces API"""
-        try:
-            response = self.session.get(f"{self.base_url}/contest.list", timeout=10)
+    async def fetch(self, session: FetchSession) -> List[Dict[str, Any]]:
+        """Fetch upcoming CF contests from Codeforces API"""
+        return [contest async for contest in self._iter_contests(session)]
+    
+    async def _iter_contests(self, session: FetchSession) -> AsyncIterator[Dict[str, Any]]:
+        """Yield upcoming CF contests while contest.list downloads.
+        
+        contest.list returns the full contest history. The body is streamed
+        and split per contest; only upcoming CF contests are decoded.
+        """
+        async with session.stream(f"{self.base_url}/contest.list", timeout=10, conditional=True) as response:
+            if response.status_code == 304:
+                raise NotModified(self.source_name)
             response.raise_for_status()
-            return response.json().get('result', [])
-        except Exception as e:
-            logger.error(f"Error fetching from Codeforces: {e}")
-            return []
+            async for contest in iter_json_array(response.aiter_bytes(), 'result', keep=_is_upcoming_cf_contest):
+                yield contest
+    
+    async def iter_parsed(self, session: FetchSession) -> AsyncIterator[Competition]:
+        """Parse contests as they are streamed instead of after the download"""
+        now = datetime.now(timezone.utc)
+        stats = session.stats
+        async for contest in stats.atimed(self._iter_contests(session), 'fetch'):
+            with stats.timer('parse'):
+                comp = self._parse_contest(contest, now)
+            if comp:
+                yield comp
     
     def parse(self, data: List[Dict[str, Any]]) -> List[Competition]:
         """Parse Codeforces contests into Competition objects"""
-        competitions = []
-        now = datetime.now()
-        
+        return list(self.iter_parse(data))
+    
+    def iter_parse(self, data: List[Dict[str, Any]]) -> Iterator[Competition]:
+        """Parse Codeforces contests one at a time"""
+        now = datetime.now(timezone.utc)
         for contest in data:
-            try:
-                # Skip if not a programming contest
-                if contest.get('type') != 'CF' or contest.get('phase') != 'BEFORE':
-                    continue
+            comp = self._parse_contest(contest, now)
+            if comp:
+                yield comp
+        
+    def _parse_contest(self, contest: Dict[str, Any], now: datetime) -> Optional[Competition]:
+        """Parse one contest, or None if it is skipped"""
+        try:
+            # Skip if not a programming contest
+            if contest.get('type') != 'CF' or contest.get('phase') != 'BEFORE':
+                return None
                 
-                start_time = datetime.fromtimestamp(contest.get('startTimeSeconds', 0))
+            start_time = datetime.fromtimestamp(contest.get('startTimeSeconds', 0), tz=timezone.utc)
                 
-                # Skip past contests
-                if start_time < now:
-                    continue
+            # Skip past contests
+            if start_time < now:
+                return None
                 
-                comp = Competition()
-                comp.id = f"codeforces_{contest.get('id')}"
-                comp.title = contest.get('name', 'Codeforces Contest')
-                comp.description = f"Codeforces {contest.get('type')} Contest"
-                comp.category = CompetitionCategory.CODING_CONTEST
-                comp.platform = "Codeforces"
+            comp = Competition()
+            comp.id = f"codeforces_{contest.get('id')}"
+            comp.title = contest.get('name', 'Codeforces Contest')
+            comp.description = f"Codeforces {contest.get('type')} Contest"
+            comp.category = CompetitionCategory.CODING_CONTEST
+            comp.platform = "Codeforces"
                 
-                # Set difficulty based on contest name
-                if 'Div. 1' in comp.title:
-                    comp.difficulty = DifficultyLevel.ADVANCED
-                elif 'Div. 2' in comp.title:
-                    comp.difficulty = DifficultyLevel.INTERMEDIATE
-                elif 'Div. 3' in comp.title or 'Div. 4' in comp.title:
-                    comp.difficulty = DifficultyLevel.BEGINNER
-                else:
-                    comp.difficulty = DifficultyLevel.INTERMEDIATE
+            # Set difficulty based on contest name
+            if 'Div. 1' in comp.title:
+                comp.difficulty = DifficultyLevel.ADVANCED
+            elif 'Div. 2' in comp.title:
+                comp.difficulty = DifficultyLevel.INTERMEDIATE
+            elif 'Div. 3' in comp.title or 'Div. 4' in comp.title:
+                comp.difficulty = DifficultyLevel.BEGINNER
+            else:
+                comp.difficulty = DifficultyLevel.INTERMEDIATE
                 
-                # Set dates and duration
-                comp.start_date = start_time
-                duration_seconds = contest.get('durationSeconds', 7200)  # Default 2 hours
-                comp.duration_hours = duration_seconds / 3600
-                comp.end_date = datetime.fromtimestamp(contest.get('startTimeSeconds', 0) + duration_seconds)
+            # Set dates and duration
+            comp.start_date = start_time
+            duration_seconds = contest.get('durationSeconds', 7200)  # Default 2 hours
+            comp.duration_hours = duration_seconds / 3600
+            comp.end_date = datetime.fromtimestamp(contest.get('startTimeSeconds', 0) + duration_seconds, tz=timezone.utc)
                 
-                # Set other properties
-                comp.link = f"https://codeforces.com/contests/{contest.get('id')}"
-                comp.registration_link = comp.link
-                comp.team_size = "solo"
-                comp.time_commitment = "medium" if comp.duration_hours <= 5 else "high"
-                comp.skills_required = ["Algorithms", "Data Structures", "Problem Solving"]
-                comp.tags = ["competitive programming", "algorithms"]
-                comp.portfolio_value = 50
-                comp.recruitment_potential = True
-                comp.companies_recruiting = ["Top Tech Companies"]
-                comp.source = "Codeforces API"
+            # Set other properties
+            comp.link = f"https://codeforces.com/contests/{contest.get('id')}"
+            comp.registration_link = comp.link
+            comp.team_size = "solo"
+            comp.time_commitment = "medium" if comp.duration_hours <= 5 else "high"
+            comp.skills_required = ["Algorithms", "Data Structures", "Problem Solving"]
+            comp.tags = ["competitive programming", "algorithms"]
+            comp.portfolio_value = 50
+            comp.recruitment_potential = True
+            comp.companies_recruiting = ["Top Tech Companies"]
+            comp.source = "Codeforces API"
                 
-                competitions.append(comp)
+            return comp
                 
-            except Exception as e:
-                logger.error(f"Error parsing Codeforces contest {contest.get('id')}: {e}")
-                continue
-        
-        return competitions
+        except Exception as e:
+            logger.error(f"Error parsing Codeforces contest {contest.get('id')}: {e}")
+            return None
@@ -1,55 +1,77 @@
-import requests
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup
+from typing import List, Iterator, Optional
 from models.competition import Competition, CompetitionCategory, DifficultyLevel
-from ..base_fetcher import BaseFetcher
+from ..base_fetcher import AsyncBaseFetcher, canonical_url, make_competition_id
+from ..html_parsing import DEFAULT_HTML_PARSER, select_cards
+from ..http_cache import NotModified
+from ..session import FetchSession
 import logging
 import re
 
 logger = logging.getLogger(__name__)
 
-class HackerRankFetcher(BaseFetcher):
+class HackerRankFetcher(AsyncBaseFetcher):
     """Fetches competitions and challenges from HackerRank"""
     
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+    }
+    
+    # Build trees with lxml for the card elements only; parse big pages off the loop
+    html_parser = DEFAULT_HTML_PARSER
+    strain_html = True
+    process_parse_threshold = 512 * 1024
+    
     def __init__(self):
         super().__init__("HackerRank")
         self.base_url = "https://www.hackerrank.com"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-        })
     
-    def fetch(self) -> List[Dict[str, Any]]:
+    async def fetch(self, session: FetchSession) -> List[str]:
         """Fetch competitions from HackerRank"""
-        try:
-            # Scrape the contests page
-            response = self.session.get(
-                f"{self.base_url}/contests",
-                timeout=15
-            )
-            response.raise_for_status()
-            
-            # Also fetch hackathons
-            hackathon_response = self.session.get(
-                f"{self.base_url}/contests?filters%5Bstatus%5D%5B%5D=active&filters%5Bstatus%5D%5B%5D=upcoming&filters%5Btype%5D%5B%5D=all&filters%5Btype%5D%5B%5D=college&filters%5Btype%5D%5B%5D=open&filters%5Btype%5D%5B%5D=private&filters%5Btype%5D%5B%5D=invitational&filters%5Btype%5D%5B%5D=public&filters%5Btype%5D%5B%5D=recruitment&filters%5Btype%5D%5B%5D=competitions&filters%5Btype%5D%5B%5D=workshops&filters%5Btype%5D%5B%5D=conferences&filters%5Btype%5D%5B%5D=hackathons",
-                timeout=15
-            )
-            
-            return [response.text, hackathon_response.text if hackathon_response.ok else ""]
-            
-        except Exception as e:
-            logger.error(f"Error fetching from HackerRank: {e}")
-            return [""]
+        contests_url = f"{self.base_url}/contests"
+        hackathons_url = f"{self.base_url}/contests?filters%5Bstatus%5D%5B%5D=active&filters%5Bstatus%5D%5B%5D=upcoming&filters%5Btype%5D%5B%5D=all&filters%5Btype%5D%5B%5D=college&filters%5Btype%5D%5B%5D=open&filters%5Btype%5D%5B%5D=private&filters%5Btype%5D%5B%5D=invitational&filters%5Btype%5D%5B%5D=public&filters%5Btype%5D%5B%5D=recruitment&filters%5Btype%5D%5B%5D=competitions&filters%5Btype%5D%5B%5D=workshops&filters%5Btype%5D%5B%5D=conferences&filters%5Btype%5D%5B%5D=hackathons"
+        
+        # Scrape the contests page, and also fetch hackathons
+        response = await session.get(contests_url, timeout=15, conditional=True)
+        hackathon_response = await session.get(hackathons_url, timeout=15, conditional=True)
+        
+        if response.status_code == 304 and hackathon_response.status_code == 304:
+            raise NotModified(self.source_name)
+        
+        # Both pages are parsed together, so re-read whichever one was unchanged
+        if response.status_code == 304:
+            response = await session.get(contests_url, timeout=15)
+        if hackathon_response.status_code == 304:
+            hackathon_response = await session.get(hackathons_url, timeout=15)
+        
+        response.raise_for_status()
+        return [response.text, hackathon_response.text if hackathon_response.is_success else ""]
+    
+    @staticmethod
+    def contest_id(link: str, title: str) -> str:
+        """Stable ID for a contest; start dates are relative ("Starts in 2 days") so they are not used"""
+        return make_competition_id("hackerrank", canonical_url(link) or title)
+    
+    @staticmethod
+    def hackathon_id(link: str, title: str) -> str:
+        """Stable ID for a hackathon"""
+        return make_competition_id("hackerrank_hack", canonical_url(link) or title)
+    
+    @staticmethod
+    def _today() -> datetime:
+        """Start of the current UTC day, so relative dates stay the same across a day's refreshes"""
+        return datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
     
     def parse(self, data: List[str]) -> List[Competition]:
         """Parse HackerRank contests into Competition objects"""
-        competitions = []
+        return list(self.iter_parse(data))
         
+    def iter_parse(self, data: List[str]) -> Iterator[Competition]:
+        """Parse HackerRank contests, yielding each Competition as its card is read"""
         if not data or not any(data):
-            return competitions
+            return
             
         contests_html = data[0]
         hackathons_html = data[1] if len(data) > 1 else ""
@@ -57,14 +79,13 @@ class HackerRankFetcher(BaseFetcher):
         # Parse regular contests
         if contests_html:
             try:
-                soup = BeautifulSoup(contests_html, 'html.parser')
-                contest_cards = soup.select('.contest-card')
+                contest_cards = select_cards(contests_html, 'contest-card', self.html_parser, self.strain_html)
                 
                 for card in contest_cards:
                     try:
                         comp = self._parse_contest_card(card)
                         if comp:
-                            competitions.append(comp)
+                            yield comp
                     except Exception as e:
                         logger.error(f"Error parsing HackerRank contest card: {e}")
                         continue
@@ -74,21 +95,18 @@ class HackerRankFetcher(BaseFetcher):
         # Parse hackathons
         if hackathons_html:
             try:
-                soup = BeautifulSoup(hackathons_html, 'html.parser')
-                hackathon_cards = soup.select('.hackathon-card')
+                hackathon_cards = select_cards(hackathons_html, 'hackathon-card', self.html_parser, self.strain_html)
                 
                 for card in hackathon_cards:
                     try:
                         comp = self._parse_hackathon_card(card)
                         if comp:
-                            competitions.append(comp)
+                            yield comp
                     except Exception as e:
                         logger.error(f"Error parsing HackerRank hackathon card: {e}")
                         continue
             except Exception as e:
                 logger.error(f"Error parsing HackerRank hackathons: {e}")
-        
-        return competitions
     
     def _parse_contest_card(self, card) -> Optional[Competition]:
         """Parse a single contest card"""
@@ -111,13 +129,13 @@ class HackerRankFetcher(BaseFetcher):
                     meta['end'] = text
             
             # Parse dates
-            now = datetime.utcnow()
+            now = self._today()
             start_date = self._parse_date(meta.get('start', ''), now)
             end_date = self._parse_date(meta.get('end', ''), now + timedelta(days=7))
             
             # Create competition object
             comp = Competition()
-            comp.id = f"hackerrank_{hash(title)}"
+            comp.id = self.contest_id(link, title)
             comp.title = title
             comp.description = f"HackerRank {'Contest'}"
             comp.category = CompetitionCategory.CODING_CONTEST
@@ -163,7 +181,7 @@ class HackerRankFetcher(BaseFetcher):
             
             # Create competition object
             comp = Competition()
-            comp.id = f"hackerrank_hack_{hash(title)}"
+            comp.id = self.hackathon_id(link, title)
             comp.title = title
             comp.description = f"HackerRank Hackathon: {title}"
             comp.category = CompetitionCategory.HACKATHON
@@ -215,15 +233,15 @@ class HackerRankFetcher(BaseFetcher):
             # Try to extract date from string like "Starts in 2 days"
             if 'starts' in date_str.lower() or 'starts' in date_str.lower():
                 if 'today' in date_str.lower():
-                    return datetime.utcnow()
+                    return self._today()
                 elif 'tomorrow' in date_str.lower():
-                    return datetime.utcnow() + timedelta(days=1)
+                    return self._today() + timedelta(days=1)
                 elif 'in' in date_str.lower():
                     # Extract number of days
                     match = re.search(r'(\d+)\s+day', date_str.lower())
                     if match:
                         days = int(match.group(1))
-                        return datetime.utcnow() + timedelta(days=days)
+                        return self._today() + timedelta(days=days)
             
             # Try to parse actual date string
             for fmt in ['%b %d, %Y', '%B %d, %Y', '%Y-%m-%d']:
@@ -238,7 +256,7 @@ class HackerRankFetcher(BaseFetcher):
     
     def _parse_hackathon_dates(self, date_str: str) -> tuple:
         """Parse hackathon date range string"""
-        now = datetime.utcnow()
+        now = self._today()
         default_end = now + timedelta(days=30)
         
         if not date_str:
@@ -282,6 +300,6 @@ class HackerRankFetcher(BaseFetcher):
                 except ValueError:
                     continue
                     
-            return datetime.utcnow()
+            return self._today()
         except Exception:
-            return datetime.utcnow()
+            return self._today()
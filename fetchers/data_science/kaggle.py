@@ -1,42 +1,45 @@
-import requests
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from models.competition import Competition, CompetitionCategory, DifficultyLevel
-from ..base_fetcher import BaseFetcher
+from ..base_fetcher import AsyncBaseFetcher
+from ..http_cache import NotModified
+from ..session import FetchSession
 import logging
 
 logger = logging.getLogger(__name__)
 
-class KaggleFetcher(BaseFetcher):
+class KaggleFetcher(AsyncBaseFetcher):
     """Fetches data science competitions from Kaggle API"""
     
+    headers = {
+        'Accept': 'application/json',
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    }
+    
     def __init__(self):
         super().__init__("Kaggle")
         self.base_url = "https://www.kaggle.com/api/v1/competitions"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Accept': 'application/json',
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
     
-    def fetch(self) -> List[Dict[str, Any]]:
+    async def fetch(self, session: FetchSession) -> List[Dict[str, Any]]:
         """Fetch competitions from Kaggle API"""
-        try:
-            # Kaggle's API doesn't require authentication for public data
-            response = self.session.get(
-                f"{self.base_url}/list",
-                params={"sortBy": "latestDeadline"},
-                timeout=15
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Error fetching from Kaggle: {e}")
-            return []
+        # Kaggle's API doesn't require authentication for public data
+        response = await session.get(
+            f"{self.base_url}/list",
+            params={"sortBy": "latestDeadline"},
+            timeout=15,
+            conditional=True
+        )
+        if response.status_code == 304:
+            raise NotModified(self.source_name)
+        response.raise_for_status()
+        return response.json()
     
     def parse(self, data: List[Dict[str, Any]]) -> List[Competition]:
         """Parse Kaggle competitions into Competition objects"""
-        competitions = []
+        return list(self.iter_parse(data))
+    
+    def iter_parse(self, data: List[Dict[str, Any]]) -> Iterator[Competition]:
+        """Parse Kaggle competitions one at a time"""
         now = datetime.utcnow()
         
         for comp_data in data:
@@ -104,7 +107,7 @@ class KaggleFetcher(BaseFetcher):
                 if any(x in title_lower for x in ['tabular', 'structured']):
                     tags.append('tabular data')
                 
-                comp.tags = list(set(tags))  # Remove duplicates
+                comp.tags = sorted(set(tags))  # Remove duplicates, keep order stable
                 comp.portfolio_value = 80  # Kaggle competitions are highly valued
                 comp.recruitment_potential = True
                 comp.companies_recruiting = ["Top Tech Companies"]
@@ -118,10 +121,8 @@ class KaggleFetcher(BaseFetcher):
                         "currency": "USD"
                     }
                 
-                competitions.append(comp)
+                yield comp
                 
             except Exception as e:
                 logger.error(f"Error parsing Kaggle competition {comp_data.get('id')}: {e}")
                 continue
-        
-        return competitions
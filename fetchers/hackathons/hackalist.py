@@ -1,7 +1,7 @@
 import logging
-import requests
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import re
+from datetime import datetime, timezone
+from typing import List, Any, Iterator, Optional
 from dateutil.parser import parse as parse_date
 from dateutil import tz
 
@@ -9,66 +9,82 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from models.competition import Competition, CompetitionCategory, DifficultyLevel
-from fetchers.base_fetcher import BaseFetcher
+from models.competition import Competition, CompetitionCategory, DifficultyLevel, to_utc
+from fetchers.base_fetcher import AsyncBaseFetcher, canonical_url, make_competition_id
+from fetchers.html_parsing import DEFAULT_HTML_PARSER, select_cards
+from fetchers.http_cache import NotModified
+from fetchers.session import FetchSession
 
 logger = logging.getLogger(__name__)
 
-class HackalistFetcher(BaseFetcher):
+class HackalistFetcher(AsyncBaseFetcher):
     """Fetches hackathons from Hackalist API."""
     
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    }
+    
+    # Build trees with lxml for the hackathon tiles only; parse big pages off the loop
+    html_parser = DEFAULT_HTML_PARSER
+    strain_html = True
+    process_parse_threshold = 512 * 1024
+    
     def __init__(self):
         super().__init__("Hackalist")
-        self.base_url = "https://www.hackalist.org/api/1.0"
+        self.base_url = "https://www.hackalist.org"
         self.current_year = datetime.now().year
         
-    def fetch(self) -> List[Dict[str, Any]]:
+    async def fetch(self, session: FetchSession) -> str:
         """
-        Fetch hackathons from Hackalist API for the current year.
+        Fetch the Hackalist homepage.
+        
+        Hackalist doesn't have a public API, so the hackathon data is scraped
+        from the website's HTML in parse.
         
         Returns:
-            List of raw hackathon data dictionaries
+            Raw HTML of the hackathon listing
         """
-        hackathons = []
-        try:
-            # Hackalist API doesn't have a direct endpoint, we'll use their website's data
-            # This is a workaround since Hackalist doesn't have a public API
-            # We'll implement web scraping in the parse method
-            # For now, return an empty list and handle everything in parse
-            return []
-        except Exception as e:
-            logger.error(f"Error fetching from Hackalist: {e}")
-            return []
+        response = await session.get(f"{self.base_url}/", conditional=True)
+        if response.status_code == 304:
+            raise NotModified(self.source_name)
+        response.raise_for_status()
+        return response.text
+    
+    @staticmethod
+    def hackathon_id(link: str, title: str, year: int) -> str:
+        """
+        Stable ID for a hackathon edition.
+        
+        Uses the year rather than the full start date so that a corrected
+        date upstream updates the existing document instead of duplicating it.
+        """
+        return make_competition_id("hackalist", canonical_url(link) or title, year)
     
-    def parse(self, data: List[Dict[str, Any]]) -> List[Competition]:
+    def parse(self, data: str) -> List[Competition]:
         """
-        Parse raw hackathon data into Competition objects.
+        Parse scraped hackathon HTML into Competition objects.
         
         Args:
-            data: Raw hackathon data (unused in this implementation)
+            data: Raw HTML of the Hackalist homepage
             
         Returns:
             List of Competition objects
         """
+        return list(self.iter_parse(data))
+    
+    def iter_parse(self, data: str) -> Iterator[Competition]:
+        """
+        Parse scraped hackathon HTML, yielding each Competition as its card is read.
+        
+        Args:
+            data: Raw HTML of the Hackalist homepage
+        """
+        if not data:
+            return
+        
         try:
-            # Since Hackalist doesn't have a public API, we'll use web scraping
-            # to get the hackathon data
-            url = f"https://www.hackalist.org/"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            from bs4 import BeautifulSoup
-            import re
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            hackathons = []
-            
             # Find all hackathon cards
-            hackathon_cards = soup.select('.hackathon-tile')
+            hackathon_cards = select_cards(data, 'hackathon-tile', self.html_parser, self.strain_html)
             
             for card in hackathon_cards:
                 try:
@@ -93,6 +109,7 @@ class HackalistFetcher(BaseFetcher):
                     # Parse date range (e.g., "Jan 5 - 7, 2024")
                     start_date = None
                     end_date = None
+                    year = self.current_year
                     if date_str:
                         try:
                             # Extract year if present, otherwise use current year
@@ -142,7 +159,7 @@ class HackalistFetcher(BaseFetcher):
                     
                     # Create competition object
                     competition = Competition()
-                    competition.id = f"hackalist_{title.lower().replace(' ', '_')}_{year}"
+                    competition.id = self.hackathon_id(url, title, year)
                     competition.title = title
                     competition.link = url
                     competition.start_date = start_date
@@ -170,16 +187,13 @@ class HackalistFetcher(BaseFetcher):
                                 "currency": "USD"
                             }
                     
-                    hackathons.append(competition)
+                    yield competition
                     
                 except Exception as e:
                     logger.error(f"Error parsing hackathon: {e}", exc_info=True)
             
-            return hackathons
-            
         except Exception as e:
             logger.error(f"Error parsing Hackalist data: {e}", exc_info=True)
-            return []
     
     def validate_competition(self, competition: Competition) -> bool:
         """
@@ -196,29 +210,11 @@ class HackalistFetcher(BaseFetcher):
             return False
             
         # Check if the hackathon is in the future
-        if competition.end_date and competition.end_date < datetime.now():
+        if competition.end_date and to_utc(competition.end_date) < datetime.now(timezone.utc):
             return False
             
         return True
     
-    def deduplicate(self, competitions: List[Competition]) -> List[Competition]:
-        """
-        Deduplicate competitions by link and title.
-        
-        Args:
-            competitions: List of Competition objects
-            
-        Returns:
-            Deduplicated list of Competition objects
-        """
-        seen = set()
-        deduped = []
-        
-        for comp in competitions:
-            # Create a unique key based on title and link
-            key = (comp.title.lower(), comp.link.lower() if comp.link else "")
-            if key not in seen:
-                seen.add(key)
-                deduped.append(comp)
-                
-        return deduped
+    def dedupe_key(self, comp: Competition) -> Any:
+        """Deduplicate competitions by title and link, ignoring case."""
+        return (comp.title.lower(), comp.link.lower() if comp.link else "")
@@ -0,0 +1,26 @@
+from typing import List
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
+
+# lxml builds the tree in C and is several times faster than the pure-Python html.parser
+DEFAULT_HTML_PARSER = 'lxml'
+
+def select_cards(html: str, card_class: str, parser: str = DEFAULT_HTML_PARSER, strain: bool = True) -> List[Tag]:
+    """Return every element carrying card_class in html.
+    
+    With strain=True a SoupStrainer limits tree building to the card
+    elements and their descendants; the rest of the page (navigation,
+    scripts, footers) is tokenized but never turned into Python objects.
+    With strain=False the full document tree is built, as before.
+    """
+    parse_only = SoupStrainer(class_=card_class) if strain else None
+    soup = BeautifulSoup(html, parser, parse_only=parse_only)
+    return soup.select(f'.{card_class}')
+
+def payload_size(data) -> int:
+    """Approximate size in characters of a fetcher's raw payload (str or list of str)"""
+    if isinstance(data, (str, bytes)):
+        return len(data)
+    if isinstance(data, (list, tuple)):
+        return sum(payload_size(item) for item in data)
+    return 0
@@ -0,0 +1,104 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+import asyncio
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+class NotModified(Exception):
+    """Raised by a fetcher when every resource it reads answered 304 Not Modified"""
+    
+    def __init__(self, source_name: str):
+        super().__init__(f"{source_name} data not modified upstream")
+        self.source_name = source_name
+
+
+class ValidatorCache:
+    """In-memory store of HTTP cache validators (ETag / Last-Modified) keyed by URL.
+    
+    Subclasses persist the validators so conditional requests survive restarts.
+    """
+    
+    def __init__(self):
+        self._validators: Dict[str, Dict[str, str]] = {}
+    
+    async def get(self, url: str) -> Optional[Dict[str, str]]:
+        return self._validators.get(url)
+    
+    async def set(self, url: str, validators: Dict[str, str]) -> None:
+        self._validators[url] = validators
+
+
+class FileValidatorCache(ValidatorCache):
+    """Validator cache persisted as a JSON file on local disk"""
+    
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self._loaded = False
+    
+    def _load(self) -> None:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._validators = json.load(f)
+        except FileNotFoundError:
+            self._validators = {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable validator cache {self.path}: {e}")
+            self._validators = {}
+        self._loaded = True
+    
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._validators, f)
+        os.replace(tmp_path, self.path)
+    
+    async def get(self, url: str) -> Optional[Dict[str, str]]:
+        if not self._loaded:
+            await asyncio.to_thread(self._load)
+        return await super().get(url)
+    
+    async def set(self, url: str, validators: Dict[str, str]) -> None:
+        if not self._loaded:
+            await asyncio.to_thread(self._load)
+        await super().set(url, validators)
+        await asyncio.to_thread(self._save)
+
+
+class MongoValidatorCache(ValidatorCache):
+    """Validator cache persisted in a MongoDB collection (the metadata collection)"""
+    
+    KEY_PREFIX = "http_validators:"
+    
+    def __init__(self, collection: Any):
+        super().__init__()
+        self.collection = collection
+    
+    async def get(self, url: str) -> Optional[Dict[str, str]]:
+        if url in self._validators:
+            return self._validators[url]
+        try:
+            doc = await self.collection.find_one({"_id": self.KEY_PREFIX + url})
+        except Exception as e:
+            logger.warning(f"Error loading validators for {url}: {e}")
+            return None
+        if not doc:
+            return None
+        validators = {k: doc[k] for k in ('etag', 'last_modified') if doc.get(k)}
+        self._validators[url] = validators
+        return validators
+    
+    async def set(self, url: str, validators: Dict[str, str]) -> None:
+        await super().set(url, validators)
+        try:
+            await self.collection.update_one(
+                {"_id": self.KEY_PREFIX + url},
+                {"$set": {**validators, "updated_at": datetime.now()}},
+                upsert=True
+            )
+        except Exception as e:
+            logger.warning(f"Error saving validators for {url}: {e}")
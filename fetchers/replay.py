@@ -0,0 +1,45 @@
+"""
+Offline replay of archived fetcher responses.
+
+Re-runs parse/validate/deduplicate over a run recorded by ResponseArchive,
+without touching the network:
+    
+    python -m fetchers.replay codeforces --archive .cache/fetch_archive
+"""
+import argparse
+import asyncio
+import time
+
+from fetchers import ResponseArchive, CodeforcesFetcher, KaggleFetcher, HackerRankFetcher, HackalistFetcher
+
+FETCHER_CLASSES = {
+    "codeforces": CodeforcesFetcher,
+    "kaggle": KaggleFetcher,
+    "hackerrank": HackerRankFetcher,
+    "hackalist": HackalistFetcher,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay archived fetcher responses offline")
+    parser.add_argument("source", choices=sorted(FETCHER_CLASSES))
+    parser.add_argument("--archive", default=".cache/fetch_archive", help="Archive root directory")
+    parser.add_argument("--run-id", default=None, help="Run to replay (default: latest)")
+    parser.add_argument("--list", action="store_true", help="List archived runs and exit")
+    args = parser.parse_args()
+    
+    archive = ResponseArchive(args.archive)
+    fetcher = FETCHER_CLASSES[args.source]()
+    
+    if args.list:
+        print("\n".join(archive.list_runs(fetcher.source_name)))
+        return
+    
+    started = time.perf_counter()
+    competitions = asyncio.run(fetcher.run(archive=archive, replay=True, run_id=args.run_id))
+    elapsed = time.perf_counter() - started
+    print(f"{fetcher.source_name}: {len(competitions)} competitions in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Optional
+import httpx
+import random
+
+# Upstream statuses worth retrying: rate limiting and transient gateway/server errors
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with full jitter for transient HTTP failures.
+    
+    max_attempts counts the first try, so max_attempts=1 disables retries.
+    A Retry-After header is honoured, capped at max_backoff.
+    """
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    max_backoff: float = 8.0
+    
+    def is_retryable_error(self, error: Exception) -> bool:
+        return isinstance(error, httpx.TransportError)
+    
+    def is_retryable_response(self, response: httpx.Response) -> bool:
+        return response.status_code in RETRYABLE_STATUSES
+    
+    def delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Seconds to wait after the given (1-based) failed attempt"""
+        retry_after = _retry_after_seconds(response) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff_base * 2 ** (attempt - 1)))
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get('retry-after')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,220 @@
+import httpx
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+from .archive import ResponseArchive
+from .http_cache import ValidatorCache
+from .retry import RetryPolicy
+from .stats import IngestStats
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+class FetchSession:
+    """Per-run HTTP session handed to AsyncBaseFetcher.fetch.
+    
+    Wraps the shared httpx.AsyncClient so that every request a fetcher makes
+    goes through one place, with the fetcher's default headers applied.
+    When no shared client is given, a short-lived one is opened and closed
+    with the session.
+    
+    With a ValidatorCache, requests made with conditional=True send
+    If-None-Match / If-Modified-Since. New validators are only persisted by
+    commit(), once the caller has stored the data they describe.
+    
+    With a ResponseArchive, every response body is archived and the run's
+    manifest is written when the session closes. In replay mode no network
+    is used: responses are served from an archived run instead.
+    
+    Transport errors and 429/5xx gateway responses are retried according
+    to the RetryPolicy; retries counts how many were made.
+    
+    Requests, retries and bytes downloaded are also added to stats, the
+    IngestStats of the run this session belongs to.
+    """
+    
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient],
+        source_name: str,
+        headers: Optional[Dict[str, str]] = None,
+        validators: Optional[ValidatorCache] = None,
+        archive: Optional[ResponseArchive] = None,
+        replay: bool = False,
+        run_id: Optional[str] = None,
+        retry: Optional[RetryPolicy] = None,
+        stats: Optional[IngestStats] = None
+    ):
+        if replay and archive is None:
+            raise ValueError("Replay mode requires an archive")
+        
+        self.client = client
+        self.source_name = source_name
+        self.headers = headers or {}
+        self.validators = None if replay else validators
+        self.archive = archive
+        self.replay = replay
+        self.run_id = run_id
+        self.retry = retry or RetryPolicy()
+        self.retries = 0
+        self.stats = stats or IngestStats()
+        self._owns_client = client is None and not replay
+        self._pending_validators: Dict[str, Dict[str, str]] = {}
+        self._recorded: Dict[str, Dict[str, Any]] = {}
+        self._replay_manifest: Optional[Dict[str, Any]] = None
+    
+    async def __aenter__(self) -> 'FetchSession':
+        if self.replay:
+            self._replay_manifest = await asyncio.to_thread(
+                self.archive.load_run, self.source_name, self.run_id
+            )
+            self.run_id = self._replay_manifest['run_id']
+        elif self.client is None:
+            self.client = httpx.AsyncClient(follow_redirects=True)
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        if self._recorded:
+            self.run_id = await asyncio.to_thread(self.archive.save_run, self.source_name, self._recorded)
+            logger.info(f"{self.source_name}: archived {len(self._recorded)} responses as run {self.run_id}")
+        if self._owns_client and self.client is not None:
+            await self.client.aclose()
+            self.client = None
+    
+    async def get(self, url: str, conditional: bool = False, **kwargs) -> httpx.Response:
+        """Issue a GET request through the shared client.
+        
+        With conditional=True, a 304 response is returned as-is; callers
+        check response.status_code before raise_for_status().
+        """
+        cache_key, headers = await self._prepare(url, conditional, kwargs)
+        if self.replay:
+            return await self._replay_response(cache_key)
+        
+        response = await self._send_with_retry(
+            cache_key, lambda: self.client.get(url, headers=headers, **kwargs)
+        )
+        self.stats.count('bytes_fetched', response.num_bytes_downloaded)
+        await self._record(cache_key, response)
+        self._remember_validators(cache_key, response, conditional)
+        return response
+    
+    @asynccontextmanager
+    async def stream(self, url: str, conditional: bool = False, **kwargs) -> AsyncIterator[httpx.Response]:
+        """Issue a streaming GET; read the body with response.aiter_bytes().
+        
+        Behaves like get() otherwise. While archiving, the body has to be
+        read in full before it is handed over, so streaming saves nothing then.
+        """
+        cache_key, headers = await self._prepare(url, conditional, kwargs)
+        if self.replay:
+            yield await self._replay_response(cache_key)
+            return
+        
+        request = self.client.build_request('GET', url, headers=headers, **kwargs)
+        response = await self._send_with_retry(
+            cache_key, lambda: self.client.send(request, stream=True)
+        )
+        try:
+            if self.archive is not None and response.status_code != 304:
+                await response.aread()
+                await self._record(cache_key, response)
+            self._remember_validators(cache_key, response, conditional)
+            yield response
+        finally:
+            await response.aclose()
+            self.stats.count('bytes_fetched', response.num_bytes_downloaded)
+    
+    async def _send_with_retry(
+        self,
+        cache_key: str,
+        send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Call send, retrying transient failures with backoff"""
+        attempt = 1
+        while True:
+            self.stats.count('requests')
+            try:
+                response = await send()
+            except Exception as e:
+                if attempt >= self.retry.max_attempts or not self.retry.is_retryable_error(e):
+                    raise
+                reason = type(e).__name__
+                delay = self.retry.delay(attempt)
+            else:
+                if attempt >= self.retry.max_attempts or not self.retry.is_retryable_response(response):
+                    return response
+                reason = f"HTTP {response.status_code}"
+                delay = self.retry.delay(attempt, response)
+                await response.aclose()
+            
+            logger.warning(f"{self.source_name}: {cache_key} failed ({reason}), retrying in {delay:.1f}s")
+            self.retries += 1
+            self.stats.count('retries')
+            attempt += 1
+            await asyncio.sleep(delay)
+    
+    async def _prepare(self, url: str, conditional: bool, kwargs: Dict[str, Any]) -> Tuple[str, Dict[str, str]]:
+        """Cache key and request headers (including validators) for a GET"""
+        headers = {**self.headers, **kwargs.pop('headers', {})}
+        request_url = httpx.URL(url)
+        if kwargs.get('params'):
+            request_url = request_url.copy_merge_params(kwargs['params'])
+        cache_key = str(request_url)
+        
+        if conditional and self.validators is not None:
+            cached = await self.validators.get(cache_key)
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
+        return cache_key, headers
+        
+    async def _record(self, cache_key: str, response: httpx.Response) -> None:
+        """Archive a response body, if archiving"""
+        if self.archive is None or response.status_code == 304:
+            return
+        digest = await asyncio.to_thread(self.archive.put, response.content)
+        self._recorded[cache_key] = {
+            'sha256': digest,
+            'status': response.status_code,
+            'content_type': response.headers.get('content-type'),
+        }
+        
+    def _remember_validators(self, cache_key: str, response: httpx.Response, conditional: bool) -> None:
+        """Hold on to a response's validators until commit()"""
+        if conditional and response.status_code == 304:
+            logger.info(f"{self.source_name}: {cache_key} not modified")
+        elif conditional and response.is_success:
+            validators = {}
+            if response.headers.get('etag'):
+                validators['etag'] = response.headers['etag']
+            if response.headers.get('last-modified'):
+                validators['last_modified'] = response.headers['last-modified']
+            if validators:
+                self._pending_validators[cache_key] = validators
+    
+    async def _replay_response(self, cache_key: str) -> httpx.Response:
+        """Build a response for cache_key from the archived run"""
+        record = self._replay_manifest['responses'].get(cache_key)
+        if record is None:
+            raise LookupError(f"{cache_key} not found in archived run {self.run_id}")
+        body = await asyncio.to_thread(self.archive.get, record['sha256'])
+        self.stats.count('requests')
+        self.stats.count('bytes_fetched', len(body))
+        headers = {'content-type': record['content_type']} if record.get('content_type') else {}
+        return httpx.Response(
+            record['status'],
+            content=body,
+            headers=headers,
+            request=httpx.Request('GET', cache_key)
+        )
+    
+    async def commit(self) -> None:
+        """Persist validators seen during this session"""
+        if self.validators is None:
+            return
+        for cache_key, validators in self._pending_validators.items():
+            await self.validators.set(cache_key, validators)
+        self._pending_validators.clear()
@@ -0,0 +1,73 @@
+from contextlib import contextmanager
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator
+import time
+
+# Pipeline stages, in order; streamed stages interleave, so each is the time spent inside it
+STAGES = ('fetch', 'parse', 'normalize', 'validate', 'dedupe', 'convert', 'store')
+
+COUNTERS = (
+    'requests', 'retries', 'bytes_fetched',
+    'parsed', 'rejected', 'duplicates', 'cross_source_duplicates',
+    'inserted', 'updated', 'unchanged', 'failed',
+)
+
+class IngestStats:
+    """Counters and per-stage timings for one run of a fetcher.
+    
+    Created by the caller and carried by the FetchSession, so the session,
+    the fetcher pipeline and the store step all add to the same object.
+    Stage durations accumulate: with streaming ingestion, fetch and parse
+    interleave, and each stage is charged only for the time spent in it.
+    """
+    
+    def __init__(self):
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.durations: Dict[str, float] = dict.fromkeys(STAGES, 0.0)
+    
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+    
+    def add_time(self, stage: str, seconds: float) -> None:
+        self.durations[stage] = self.durations.get(stage, 0.0) + seconds
+    
+    @contextmanager
+    def timer(self, stage: str) -> Iterator[None]:
+        """Charge the time spent in the with-block to stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.perf_counter() - start)
+    
+    def timed(self, iterable: Iterable[Any], stage: str) -> Iterator[Any]:
+        """Iterate, charging the time spent producing each item to stage"""
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.add_time(stage, time.perf_counter() - start)
+            yield item
+    
+    async def atimed(self, iterable: AsyncIterable[Any], stage: str) -> AsyncIterator[Any]:
+        """Async version of timed()"""
+        iterator = iterable.__aiter__()
+        while True:
+            start = time.perf_counter()
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                self.add_time(stage, time.perf_counter() - start)
+            yield item
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Counters plus stage durations in milliseconds"""
+        return {
+            **self.counters,
+            'stage_ms': {stage: round(seconds * 1000, 1) for stage, seconds in self.durations.items()},
+        }
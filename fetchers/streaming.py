@@ -0,0 +1,140 @@
+from typing import AsyncIterator, Callable, List, Optional
+import json
+import re
+
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+
+# One lexical token: a complete string, an unterminated string (needs more input) or a bracket
+_TOKEN = re.compile(_STRING + rb'|"|[{}\[\]]')
+
+# A complete object with no nested objects or arrays, matched in one pass by the regex engine
+_FLAT_OBJECT = re.compile(rb'\{(?:[^{}\[\]"\\]*' + _STRING + rb')*[^{}\[\]"\\]*\}')
+
+# Whitespace and the comma between two array elements
+_SEPARATOR = re.compile(rb'[\s,]*')
+
+class JsonArrayScanner:
+    """Incrementally splits the objects of one JSON array out of a byte stream.
+    
+    Feed it response chunks; it returns the raw bytes of every complete
+    element of the array stored under array_key, without decoding them.
+    Callers can cheaply reject elements on their raw bytes and only
+    json.loads the ones they keep. Strings are skipped whole by the
+    tokenizer, so brackets inside them are never miscounted.
+    
+    The array key is located by its first occurrence in the stream, which
+    holds for envelopes like {"status": "OK", "result": [...]}.
+    """
+    
+    def __init__(self, array_key: str):
+        self._array_start = re.compile(rb'"' + re.escape(array_key.encode()) + rb'"\s*:\s*\[')
+        self._buffer = b''
+        self._pos = 0
+        self._in_array = False
+        self._done = False
+        self._depth = 0
+        self._element_start: Optional[int] = None
+    
+    @property
+    def done(self) -> bool:
+        """True once the closing bracket of the array has been read"""
+        return self._done
+    
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Consume a chunk and return the elements completed by it"""
+        if self._done:
+            return []
+        self._buffer += chunk
+        
+        if not self._in_array:
+            match = self._array_start.search(self._buffer)
+            if not match:
+                # Keep a tail long enough to hold a key split across chunks
+                self._buffer = self._buffer[-256:]
+                return []
+            self._in_array = True
+            self._pos = match.end()
+        
+        elements = []
+        buffer = self._buffer
+        pos = self._pos
+        while True:
+            if self._depth == 0:
+                if buffer.startswith(b',{', pos):
+                    pos += 1
+                elif not buffer.startswith(b'{', pos):
+                    pos = _SEPARATOR.match(buffer, pos).end()
+                    if buffer.startswith(b']', pos):
+                        self._done = True
+                        break
+            
+            if self._depth == 0 and buffer.startswith(b'{', pos):
+                # Fast path for flat objects: without backslashes, an even number of
+                # quotes before the first '}' means it is outside any string
+                end = buffer.find(b'}', pos) + 1
+                if end:
+                    candidate = buffer[pos:end]
+                    if (candidate.count(b'{') == 1 and b'[' not in candidate
+                            and b'\\' not in candidate and candidate.count(b'"') % 2 == 0):
+                        elements.append(candidate)
+                        pos = end
+                        continue
+                
+                # Flat objects with escapes or braces inside strings
+                flat = _FLAT_OBJECT.match(buffer, pos)
+                if flat:
+                    elements.append(flat.group())
+                    pos = flat.end()
+                    continue
+            
+            # Nested or incomplete element: track brackets token by token
+            match = _TOKEN.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            token = match.group()
+            if token == b'"':
+                # String continues in the next chunk; resume from its opening quote
+                pos = match.start()
+                break
+            pos = match.end()
+            if token in (b'{', b'['):
+                if self._depth == 0:
+                    self._element_start = match.start()
+                self._depth += 1
+            elif token in (b'}', b']'):
+                if self._depth == 0:
+                    # Closing bracket of the array itself
+                    self._done = True
+                    break
+                self._depth -= 1
+                if self._depth == 0:
+                    elements.append(buffer[self._element_start:match.end()])
+                    self._element_start = None
+        self._pos = pos
+        
+        # Drop everything before the element being read (or before the resume point)
+        keep_from = self._element_start if self._element_start is not None else self._pos
+        self._buffer = self._buffer[keep_from:]
+        self._pos -= keep_from
+        if self._element_start is not None:
+            self._element_start = 0
+        return elements
+
+async def iter_json_array(
+    chunks: AsyncIterator[bytes],
+    array_key: str,
+    keep: Optional[Callable[[bytes], bool]] = None
+) -> AsyncIterator[dict]:
+    """Yield decoded elements of the array under array_key from a byte stream.
+    
+    keep receives each element's raw bytes; elements it rejects are never
+    decoded into Python objects.
+    """
+    scanner = JsonArrayScanner(array_key)
+    async for chunk in chunks:
+        for raw in scanner.feed(chunk):
+            if keep is None or keep(raw):
+                yield json.loads(raw)
+        if scanner.done:
+            break
@@ -1,10 +1,15 @@
 # This file makes the models directory a Python package
-from .competition import Competition, CompetitionCategory, DifficultyLevel
+from .competition import Competition, CompetitionCategory, DifficultyLevel, compute_content_hash, normalize_key, normalize_tags, to_epoch, to_utc
 from .user_profile import UserProfile
 
 __all__ = [
     'Competition',
     'CompetitionCategory',
     'DifficultyLevel',
+    'compute_content_hash',
+    'normalize_key',
+    'normalize_tags',
+    'to_epoch',
+    'to_utc',
     'UserProfile'
 ]
@@ -1,7 +1,48 @@
 from enum import Enum
-from datetime import datetime
+from datetime import datetime, timezone, tzinfo
 from typing import List, Optional, Dict
 from dataclasses import dataclass, field
+import hashlib
+import json
+
+# Bookkeeping fields that change on every scrape and are left out of the content hash
+VOLATILE_FIELDS = ('last_updated', 'scraped_at', 'content_hash')
+
+# Fields stored as BSON datetimes (UTC)
+DATE_FIELDS = ('start_date', 'end_date', 'registration_deadline', 'last_updated', 'scraped_at')
+
+# Dates that also get an integer epoch-seconds field for cheap comparisons
+EPOCH_FIELDS = {'start_date': 'start_ts', 'end_date': 'end_ts', 'registration_deadline': 'registration_deadline_ts'}
+
+def to_utc(value: Optional[datetime], naive_tz: tzinfo = timezone.utc) -> Optional[datetime]:
+    """Timezone-aware UTC datetime; naive values are taken to be in naive_tz (UTC by default)."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=naive_tz)
+    return value.astimezone(timezone.utc)
+
+def to_epoch(value: Optional[datetime]) -> Optional[int]:
+    """Whole seconds since the Unix epoch, with naive values taken to be UTC."""
+    if value is None:
+        return None
+    return int(to_utc(value).timestamp())
+
+def normalize_key(value: Optional[str]) -> Optional[str]:
+    """Case- and whitespace-insensitive form of a platform or tag, for exact indexed lookups."""
+    if value is None:
+        return None
+    return ' '.join(value.split()).casefold() or None
+
+def normalize_tags(tags: Optional[List[str]]) -> List[str]:
+    """Distinct normalized tags, sorted."""
+    return sorted({key for key in map(normalize_key, tags or []) if key})
+
+def compute_content_hash(data: dict) -> str:
+    """Stable hash over a competition dict's semantic fields."""
+    content = {k: v for k, v in data.items() if k not in VOLATILE_FIELDS and k != '_id'}
+    payload = json.dumps(content, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
 
 class CompetitionCategory(Enum):
     HACKATHON = "hackathon"
@@ -70,12 +111,13 @@ class Competition:
     
     # Metadata
     source: str = None  # API or Scraper used
-    last_updated: datetime = field(default_factory=datetime.now)
-    scraped_at: datetime = field(default_factory=datetime.now)
+    duplicate_of: Optional[str] = None  # ID of the same competition listed by another source
+    last_updated: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    scraped_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
     def to_dict(self) -> dict:
-        """Convert the Competition object to a dictionary."""
-        return {
+        """Convert the Competition object to a dictionary, including its content hash."""
+        data = {
             'id': self.id,
             'title': self.title,
             'description': self.description,
@@ -83,9 +125,9 @@ class Competition:
             'subcategory': self.subcategory,
             'platform': self.platform,
             'company': self.company,
-            'start_date': self.start_date.isoformat() if self.start_date else None,
-            'end_date': self.end_date.isoformat() if self.end_date else None,
-            'registration_deadline': self.registration_deadline.isoformat() if self.registration_deadline else None,
+            'start_date': to_utc(self.start_date),
+            'end_date': to_utc(self.end_date),
+            'registration_deadline': to_utc(self.registration_deadline),
             'duration_hours': self.duration_hours,
             'time_commitment': self.time_commitment,
             'difficulty': self.difficulty.value if self.difficulty else None,
@@ -103,9 +145,17 @@ class Competition:
             'companies_recruiting': self.companies_recruiting,
             'portfolio_value': self.portfolio_value,
             'source': self.source,
-            'last_updated': self.last_updated.isoformat(),
-            'scraped_at': self.scraped_at.isoformat()
+            'duplicate_of': self.duplicate_of,
+            'last_updated': to_utc(self.last_updated),
+            'scraped_at': to_utc(self.scraped_at)
         }
+        for date_field, epoch_field in EPOCH_FIELDS.items():
+            data[epoch_field] = to_epoch(getattr(self, date_field))
+        # Lowercase shadow fields behind the platform and tag filters
+        data['platform_norm'] = normalize_key(self.platform)
+        data['tags_norm'] = normalize_tags(self.tags)
+        data['content_hash'] = compute_content_hash(data)
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Competition':
@@ -113,7 +163,7 @@ class Competition:
         comp = cls()
         for key, value in data.items():
             if hasattr(comp, key):
-                if key in ['start_date', 'end_date', 'registration_deadline', 'last_updated', 'scraped_at'] and value:
+                if key in DATE_FIELDS and value:
                     setattr(comp, key, datetime.fromisoformat(value) if isinstance(value, str) else value)
                 elif key == 'category' and value:
                     setattr(comp, key, CompetitionCategory(value))